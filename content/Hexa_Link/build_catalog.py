@@ -0,0 +1,55 @@
+"""
+Genera el catálogo precalculado de puzzles de Hexa-Link.
+
+Uso (desde la carpeta content):
+    python -m Hexa_Link.build_catalog [--palabras RUTA] [--salida RUTA] [--procesos N]
+
+Recorre todas las combinaciones (pool de 7 letras, letra central) del diccionario y guarda
+las que cumplen la ventana MIN_WORDS/MAX_WORDS con exactamente un heptacrack, para que
+GameState elija un puzzle al azar sin buscarlo en tiempo de ejecución.
+Cada puzzle se guarda con su dificultad, calculada con NumPy (si no está instalado, todas quedan en 0).
+"""
+import argparse
+import os
+import time
+from .game.constants import WORDS_FILE, CATALOG_FILE
+from .game.word_logic import obtener_indice, BIT_LETRA
+from .game.puzzle_catalog import enumerar_puzzles, guardar_catalogo, pools_candidatos, decodificar_entrada, huella_diccionario
+
+
+def calcular_dificultades(indice, entradas):
+    try:
+        from .game.difficulty import puntuar_dificultad
+    except ImportError:
+        print("[CATALOGO] NumPy no está instalado: el catálogo se guarda sin dificultad.")
+        return None
+    pools, centros = [], []
+    for entrada in entradas:
+        pool, center = decodificar_entrada(entrada)
+        pools.append(sum(BIT_LETRA[l] for l in pool))
+        centros.append(BIT_LETRA[center])
+    return puntuar_dificultad(indice, pools, centros)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Genera el catálogo de puzzles de Hexa-Link.")
+    parser.add_argument("--palabras", default=str(WORDS_FILE), help="Archivo de palabras de origen.")
+    parser.add_argument("--salida", default=str(CATALOG_FILE), help="Ruta del catálogo a generar.")
+    parser.add_argument("--procesos", type=int, default=os.cpu_count() or 1,
+                        help="Procesos para evaluar los pools en paralelo (1 = secuencial).")
+    args = parser.parse_args(argv)
+
+    inicio = time.perf_counter()
+    indice = obtener_indice(args.palabras)
+    pools = pools_candidatos(indice)
+    inicio_enum = time.perf_counter()
+    entradas = enumerar_puzzles(indice, procesos=args.procesos, pools=pools)
+    duracion_enum = time.perf_counter() - inicio_enum
+    guardar_catalogo(entradas, args.salida, calcular_dificultades(indice, entradas), huella_diccionario(args.palabras))
+    ritmo = len(pools) / duracion_enum if duracion_enum > 0 else float("inf")
+    print(f"[CATALOGO] {len(pools)} pools evaluados con {args.procesos} proceso(s): {ritmo:,.0f} pools/s")
+    print(f"[CATALOGO] {len(entradas)} puzzles guardados en {args.salida} ({time.perf_counter() - inicio:.2f}s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -12,7 +12,7 @@ Este paquete contiene toda la lógica del juego, incluyendo:
 from Hexa_Link.game.main_game import HexGame           # Clase principal del juego, controla el bucle y la UI.
 from Hexa_Link.game.game_state import GameState        # Estado del juego: letras, palabras, puntaje, etc.
 from Hexa_Link.game.animations import FireAnimation    # Animación de fuego para combos.
-from Hexa_Link.game.word_logic import cargar_pals, elegir  # Lógica de palabras y letras.
+from Hexa_Link.game.word_logic import cargar_pals, elegir, generar_puzzle, puzzle_diario  # Lógica de palabras y letras.
 from Hexa_Link.game.ui_elements import (
     hexagon_points,        # Calcula los puntos de un hexágono (para dibujar).
     is_over_hexagon,       # Detecta si el mouse está sobre un hexágono.
@@ -34,6 +34,8 @@ __all__ = [
     'FireAnimation',
     'cargar_pals',
     'elegir',
+    'generar_puzzle',
+    'puzzle_diario',
     'hexagon_points',
     'is_over_hexagon',
     'draw_hexagons',
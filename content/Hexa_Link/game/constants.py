@@ -37,6 +37,12 @@ COMBO_DURATION_MS = 2000
 BASE_DIR = Path(__file__).parent.parent
 ASSETS_DIR = BASE_DIR / "assets"
 WORDS_FILE = ASSETS_DIR / "palabraspremium_actualizado.txt"
+CATALOG_FILE = ASSETS_DIR / "puzzles.catalogo"  # Generado con: python -m Hexa_Link.build_catalog
+PREFETCH_FILE = BASE_DIR / "puzzles_prefetch.json"
+DAILY_PUZZLE_FILE = BASE_DIR / "puzzle_diario.json"
+DIFFICULTY_BANDS = ("facil", "media", "dificil")  # Tercios del catálogo ordenado por dificultad
+DIFFICULTY_BAND = None  # Banda usada al elegir puzzle (None = cualquiera)
+PREFETCH_QUEUE_SIZE = 2  # Puzzles listos que se mantienen en cola para "Nueva partida" (0 = desactivado)
 ANIMATIONS_DIR = ASSETS_DIR / "animations"
 
 # Fuente personalizada
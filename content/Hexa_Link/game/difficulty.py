@@ -0,0 +1,81 @@
+# Puntuación de dificultad de los puzzles de Hexa-Link.
+# Se calcula al generar el catálogo (python -m Hexa_Link.build_catalog), en una pasada vectorizada
+# con NumPy sobre la matriz de conteo de letras de todo el diccionario; el juego solo lee el resultado.
+
+import numpy as np
+from Hexa_Link.game.constants import MIN_letras
+from Hexa_Link.game.word_logic import ALFABETO, BIT_LETRA
+
+# Peso de cada componente en la dificultad final (se combinan por percentil)
+# (el catálogo solo tiene puzzles con exactamente un heptacrack, así que los pangramas no distinguen puzzles)
+PESOS = {
+    "n_validas": 0.35,          # Más palabras por encontrar
+    "largo_medio": 0.2,         # Palabras más largas en promedio
+    "proporcion_largas": 0.2,   # Más parte de la lista en palabras largas (cola de la distribución de largos)
+    "rareza": 0.25,             # Letras menos frecuentes en el diccionario
+}
+LARGO_PALABRA_LARGA = 6  # Desde este largo una palabra cuenta como larga
+_FILAS_POR_BLOQUE = 512
+
+
+def matriz_letras(palabras):
+    """Matriz (palabras x letras) con cuántas veces aparece cada letra del ALFABETO en cada palabra."""
+    columna = {l: i for i, l in enumerate(ALFABETO)}
+    letras = [columna[l] for w in palabras for l in w]
+    filas = np.repeat(np.arange(len(palabras)), [len(w) for w in palabras])
+    matriz = np.zeros((len(palabras), len(ALFABETO)), dtype=np.uint16)
+    np.add.at(matriz, (filas, np.asarray(letras, dtype=np.intp)), 1)
+    return matriz
+
+
+def _percentil(valores):
+    if len(valores) < 2:
+        return np.zeros(len(valores))
+    orden = valores.argsort(kind="stable").argsort(kind="stable")
+    return orden / (len(valores) - 1)
+
+
+def componentes_dificultad(indice, pools, centros, min_len=MIN_letras):
+    """
+    Calcula por puzzle: cantidad de palabras válidas, largo medio, proporción de palabras largas
+    y rareza de las letras del pool. `pools` y `centros` son máscaras (arrays o listas de enteros).
+    """
+    palabras = [w for ws in indice.values() for w in ws if len(w) >= min_len]
+    mascaras = np.array([m for m, ws in indice.items() for w in ws if len(w) >= min_len], dtype=np.int64)
+    matriz = matriz_letras(palabras)
+    largos = matriz.sum(axis=1, dtype=np.int64)
+    es_larga = (largos >= LARGO_PALABRA_LARGA).astype(np.int64)
+
+    # Rareza de cada letra: -log de su frecuencia en el diccionario
+    frecuencia = matriz.sum(axis=0, dtype=np.float64) + 1.0
+    rareza_letra = -np.log(frecuencia / frecuencia.sum())
+    bits = np.array([BIT_LETRA[l] for l in ALFABETO], dtype=np.int64)
+
+    pools = np.asarray(pools, dtype=np.int64)
+    centros = np.asarray(centros, dtype=np.int64)
+    n_validas = np.zeros(len(pools), dtype=np.int64)
+    suma_largos = np.zeros(len(pools), dtype=np.int64)
+    n_largas = np.zeros(len(pools), dtype=np.int64)
+    for ini in range(0, len(pools), _FILAS_POR_BLOQUE):
+        p = pools[ini:ini + _FILAS_POR_BLOQUE, None]
+        c = centros[ini:ini + _FILAS_POR_BLOQUE, None]
+        validas = ((mascaras[None, :] & ~p) == 0) & ((mascaras[None, :] & c) != 0)
+        n_validas[ini:ini + len(p)] = validas.sum(axis=1)
+        suma_largos[ini:ini + len(p)] = validas @ largos
+        n_largas[ini:ini + len(p)] = validas @ es_larga
+
+    letras_pool = (pools[:, None] & bits[None, :]) != 0
+    rareza = (letras_pool @ rareza_letra) / np.maximum(letras_pool.sum(axis=1), 1)
+    return {
+        "n_validas": n_validas,
+        "largo_medio": suma_largos / np.maximum(n_validas, 1),
+        "proporcion_largas": n_largas / np.maximum(n_validas, 1),
+        "rareza": rareza,
+    }
+
+
+def puntuar_dificultad(indice, pools, centros, min_len=MIN_letras):
+    """Dificultad de cada puzzle en [0, 1] (0 = el más fácil del lote), combinando los componentes por percentil."""
+    comp = componentes_dificultad(indice, pools, centros, min_len)
+    puntaje = sum(peso * _percentil(comp[nombre]) for nombre, peso in PESOS.items())
+    return np.clip(puntaje, 0.0, 1.0)
@@ -25,7 +25,7 @@ def draw_game(game):
     if not gs.pausado:
         draw_word_count(game.screen, len(gs.pal_encontradas), gs.target_count)
         draw_hexagons(game.screen, gs.posiciones, gs.letras, gs.letra_central, pygame.mouse.get_pos())
-        draw_pal_actual(game.screen, gs.pal_actual)
+        draw_pal_actual(game.screen, gs.pal_actual, gs.prefijo_pendientes())
         draw_game_buttons(game.screen, gs, pygame.mouse.get_pos())
         draw_score(game.screen, gs.score)
         draw_combo_message(game.screen, gs.combo_msg, gs.combo_timer)
@@ -81,7 +81,7 @@ def handle_events(game):
                 else:
                     ch = event.unicode.lower()
                     if ch in gs.letras: # Comprobar si la letra está en las disponibles
-                        gs.pal_actual += ch
+                        gs.agregar_letra(ch)
             elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
                 if gs.btn_pause_rect and gs.btn_pause_rect.collidepoint(mouse_pos):
                     sonido_click()
@@ -131,7 +131,7 @@ def handle_events(game):
                             pts = hexagon_points(gs.posiciones[i], HEX_SIZE)
                             if point_in_hexagon(mouse_pos, pts):
                                 gs.combo_msg = ""
-                                gs.pal_actual += letter
+                                gs.agregar_letra(letter)
                                 break
     else: # gs.pausado is True
         pygame.mouse.set_cursor(HAND_CURSOR) # Usar cursor de mano sobre los botones de pausa
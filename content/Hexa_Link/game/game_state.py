@@ -1,6 +1,9 @@
 import math, pygame, random
 from .constants import *
 from .word_logic import elegir
+from .prefetch import tomar_puzzle
+from .prefix_trie import PrefixTrie, CursorPrefijo
+from utils.lexicon import mascara_letras
 from .state_ui import setup_letter_posiciones, poner_botones
 from .state_logic import (
     word_valida,
@@ -10,8 +13,11 @@ from .state_logic import (
 )
 
 class GameState:
-    def __init__(self):
-        self.letras_base, self.letra_central, self.pals_validas = elegir()
+    def __init__(self, puzzle=None):
+        # puzzle: (pool, center, valid) ya elegido, p. ej. generar_puzzle(seed) o puzzle_diario()
+        # Con la cola desactivada (PREFETCH_QUEUE_SIZE = 0) no se toca el archivo de la cola
+        prefetch = tomar_puzzle() if PREFETCH_QUEUE_SIZE > 0 and not puzzle else None
+        self.letras_base, self.letra_central, self.pals_validas = puzzle or prefetch or elegir()
         self.target_count, self.pal_encontradas, self.pal_actual, self.score = len(self.pals_validas), [], "", 0
         self.combo_cont, self.combo_msg, self.combo_timer, self.pausado = 0, "", 0, False
         self.pausado_time_total, self.pause_start, self.start_time = 0, 0, pygame.time.get_ticks()
@@ -20,6 +26,15 @@ class GameState:
         setup_letter_posiciones(self)
         poner_botones(self)
         self.por_inicial = {}; [self.por_inicial.setdefault(w[0], []).append(w) for w in self.pals_validas]
+        self._construir_indices()
+
+    def _construir_indices(self):
+        # Estructuras derivadas (no se guardan): búsquedas O(1) al comprobar palabras
+        self.validas_set = frozenset(self.pals_validas)
+        self.encontradas_set = set(self.pal_encontradas)
+        self.mascara_pool = mascara_letras("".join(self.letras_base)) or 0
+        self.trie = PrefixTrie(self.pals_validas, self.pal_encontradas)
+        self.cursor_prefijo = CursorPrefijo(self.trie, self.pal_actual)
 
     def word_valida(self, word):
         return word_valida(self, word)
@@ -27,11 +42,25 @@ class GameState:
     def submit_word(self):
         handle_combo_and_feedback(self)
 
-    def borrarletra(self): self.pal_actual = self.pal_actual[:-1]
-    def clear_word(self): self.pal_actual = ""
+    def agregar_letra(self, letra):
+        self.pal_actual += letra
+        self.cursor_prefijo.agregar(letra)
+    def borrarletra(self):
+        if self.pal_actual:
+            self.pal_actual = self.pal_actual[:-1]
+            self.cursor_prefijo.borrar()
+    def clear_word(self):
+        self.pal_actual = ""
+        self.cursor_prefijo.reiniciar()
+    def prefijo_pendientes(self):
+        """Palabras sin encontrar que empiezan con pal_actual (se mantiene letra a letra)."""
+        if len(self.cursor_prefijo.camino) != len(self.pal_actual) + 1:
+            self.cursor_prefijo.reiniciar(self.pal_actual)
+        return self.cursor_prefijo.pendientes()
     def toggle_pause(self):
         if not self.pausado:
-            self.pausado, self.pause_start, self.pal_actual = True, pygame.time.get_ticks(), ""
+            self.pausado, self.pause_start = True, pygame.time.get_ticks()
+            self.clear_word()
         else:
             self.pausado, self.pausado_time_total = False, self.pausado_time_total + pygame.time.get_ticks() - self.pause_start
 
@@ -109,6 +138,7 @@ class GameState:
         obj.btn_clear_rect = cls._tuple_to_rect(data.get("btn_clear_rect"))
         # Asegura que mensaje_pal siempre exista
         obj.mensaje_pal = data.get("mensaje_pal", None)
+        obj._construir_indices()
         return obj
 
     @staticmethod
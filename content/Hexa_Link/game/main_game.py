@@ -21,9 +21,11 @@ NOMUSICA_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__f
 
 # === CLASE PRINCIPAL DEL JUEGO ===
 class HexGame:
-    def __init__(self, usuario=None, game_state=None):
+    def __init__(self, usuario=None, game_state=None, puzzle=None, diario=False):
         """
         Inicializa la ventana, estado, música y recursos del juego.
+        `puzzle` permite forzar un (pool, center, valid) concreto, p. ej. el puzzle diario.
+        Con `diario` la partida no se guarda (no pisa la partida guardada del jugador).
         """
         pygame.init()
         self.screen = pygame.display.set_mode((WIDTH, HEIGHT))
@@ -35,7 +37,7 @@ class HexGame:
         if game_state is not None:
             self.game_state = game_state
         else:
-            self.game_state = GameState()
+            self.game_state = GameState(puzzle=puzzle)
 
         # Animación de fuego
         self.fire_animation = FireAnimation()
@@ -62,7 +64,8 @@ class HexGame:
         self.save_message_timer = 0
 
         # Si game_state viene de cargar partida, la consideramos guardada
-        self.partida_guardada = game_state is not None
+        self.diario = diario
+        self.partida_guardada = game_state is not None or diario  # El diario no pide confirmar al salir
 
 
     # === GUARDADO DE PARTIDA ===
@@ -72,6 +75,10 @@ class HexGame:
         """
         if not self.usuario:
             return
+        if self.diario:
+            self.save_message = "El puzzle diario no se guarda."
+            self.save_message_timer = pygame.time.get_ticks()
+            return
         from Hexa_Link.run_game import save_game_state
         save_game_state(self.usuario, self.game_state)
         self.save_message = "¡Partida guardada exitosamente!"
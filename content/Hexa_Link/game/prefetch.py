@@ -0,0 +1,128 @@
+# Cola de puzzles precargados de Hexa-Link.
+# Un hilo productor genera puzzles en segundo plano y los deja en disco, para que
+# "Nueva partida" (que arranca el juego en otro proceso) empiece sin esperar a elegir().
+# Solo el menú corre el productor; el proceso del juego únicamente saca puzzles.
+# Como son dos procesos, cada lectura-modificación-escritura del archivo se hace con
+# un bloqueo de archivo ({path}.lock), además del lock entre hilos.
+
+import contextlib
+import json
+import os
+import tempfile
+import threading
+from Hexa_Link.game.constants import PREFETCH_FILE, PREFETCH_QUEUE_SIZE
+from Hexa_Link.game.word_logic import elegir
+
+_lock = threading.Lock()
+_productor = None
+
+
+@contextlib.contextmanager
+def _bloqueo(path):
+    """Bloqueo exclusivo de la cola entre hilos y entre procesos (menú y juego)."""
+    with _lock, open(f"{path}.lock", "a+b") as f:
+        if os.name == "nt":
+            import msvcrt
+            f.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    pass # LK_LOCK se rinde tras ~10 s: seguir esperando
+            try:
+                yield
+            finally:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+def _leer(path):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        data = {}
+    data.setdefault("cola", [])
+    data.setdefault("metricas", {"hits": 0, "misses": 0})
+    return data
+
+
+def _escribir(path, data):
+    # Escritura atómica, con un temporal propio de cada escritura (el menú y el juego son procesos distintos)
+    fd, tmp_path = tempfile.mkstemp(prefix=f"{os.path.basename(path)}.", suffix=".tmp", dir=os.path.dirname(path) or ".")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+    except OSError:
+        with contextlib.suppress(OSError):
+            os.remove(tmp_path)
+        raise
+
+
+def tomar_puzzle(path=PREFETCH_FILE):
+    """Saca un puzzle (pool, center, valid) de la cola y registra hit/miss. Devuelve None si la cola está vacía."""
+    with _bloqueo(path):
+        data = _leer(path)
+        puzzle = data["cola"].pop(0) if data["cola"] else None
+        data["metricas"]["hits" if puzzle else "misses"] += 1
+        try:
+            _escribir(path, data)
+        except OSError as e:
+            print(f"[PREFETCH] No se pudo actualizar la cola: {e}")
+    m = data["metricas"]
+    print(f"[PREFETCH] {'hit' if puzzle else 'miss'} (hits={m['hits']}, misses={m['misses']})")
+    if puzzle is None:
+        return None
+    return puzzle["pool"], puzzle["center"], puzzle["valid"]
+
+
+def metricas(path=PREFETCH_FILE):
+    """Devuelve los contadores de la cola: hits, misses, tasa de acierto y puzzles listos."""
+    with _bloqueo(path):
+        data = _leer(path)
+    m = dict(data["metricas"])
+    total = m["hits"] + m["misses"]
+    m["tasa_hit"] = m["hits"] / total if total else 0.0
+    m["en_cola"] = len(data["cola"])
+    return m
+
+
+def _rellenar(tam, path):
+    while True:
+        with _bloqueo(path):
+            if len(_leer(path)["cola"]) >= tam:
+                return
+        # elegir() corre fuera del lock para no bloquear a tomar_puzzle()
+        pool, center, valid = elegir()
+        with _bloqueo(path):
+            data = _leer(path)
+            if len(data["cola"]) >= tam:
+                return
+            data["cola"].append({"pool": list(pool), "center": center, "valid": list(valid)})
+            try:
+                _escribir(path, data)
+            except OSError as e:
+                print(f"[PREFETCH] No se pudo guardar el puzzle: {e}")
+                return
+
+
+def iniciar_productor(tam=PREFETCH_QUEUE_SIZE, path=PREFETCH_FILE):
+    """
+    Arranca (si no está corriendo) el hilo que rellena la cola hasta `tam` puzzles.
+    Lo llama solo el menú de Hexa-Link, así hay un único productor por cola.
+    """
+    global _productor
+    if tam <= 0 or (_productor is not None and _productor.is_alive()):
+        return _productor
+    _productor = threading.Thread(target=_rellenar, args=(tam, path), name="hexalink-prefetch", daemon=True)
+    _productor.start()
+    return _productor
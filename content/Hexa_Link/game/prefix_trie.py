@@ -0,0 +1,87 @@
+# Trie de prefijos sobre las palabras válidas de un puzzle de Hexa-Link.
+# Cada nodo sabe cuántas palabras sin encontrar cuelgan de él, así la UI puede avisar
+# al instante si la palabra en curso ya no lleva a ninguna palabra pendiente.
+
+
+class NodoTrie:
+    __slots__ = ("hijos", "pendientes", "es_palabra", "encontrada")
+
+    def __init__(self):
+        self.hijos = {}
+        self.pendientes = 0
+        self.es_palabra = False
+        self.encontrada = False
+
+
+class PrefixTrie:
+    def __init__(self, palabras=(), encontradas=()):
+        self.raiz = NodoTrie()
+        for w in palabras:
+            self.agregar(w)
+        for w in encontradas:
+            self.marcar_encontrada(w)
+
+    def agregar(self, palabra):
+        nodo = self.raiz
+        camino = [nodo]
+        for l in palabra:
+            nodo = nodo.hijos.setdefault(l, NodoTrie())
+            camino.append(nodo)
+        if not nodo.es_palabra:
+            nodo.es_palabra = True
+            for n in camino:
+                n.pendientes += 1
+
+    def nodo(self, prefijo):
+        """Nodo del prefijo o None si ninguna palabra empieza así. O(len(prefijo))."""
+        nodo = self.raiz
+        for l in prefijo:
+            nodo = nodo.hijos.get(l)
+            if nodo is None:
+                return None
+        return nodo
+
+    def contar(self, prefijo):
+        """Cantidad de palabras sin encontrar que empiezan con `prefijo`."""
+        nodo = self.nodo(prefijo)
+        return nodo.pendientes if nodo else 0
+
+    def marcar_encontrada(self, palabra):
+        camino = [self.raiz]
+        for l in palabra:
+            siguiente = camino[-1].hijos.get(l)
+            if siguiente is None:
+                return False
+            camino.append(siguiente)
+        final = camino[-1]
+        if not final.es_palabra or final.encontrada:
+            return False
+        final.encontrada = True
+        for n in camino:
+            n.pendientes -= 1
+        return True
+
+
+class CursorPrefijo:
+    """Sigue la palabra en curso letra a letra: agregar o borrar una letra es O(1)."""
+
+    def __init__(self, trie, texto=""):
+        self.trie = trie
+        self.reiniciar(texto)
+
+    def reiniciar(self, texto=""):
+        self.camino = [self.trie.raiz]
+        for l in texto:
+            self.agregar(l)
+
+    def agregar(self, letra):
+        actual = self.camino[-1]
+        self.camino.append(actual.hijos.get(letra) if actual else None)
+
+    def borrar(self):
+        if len(self.camino) > 1:
+            self.camino.pop()
+
+    def pendientes(self):
+        nodo = self.camino[-1]
+        return nodo.pendientes if nodo else 0
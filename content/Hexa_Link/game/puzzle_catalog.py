@@ -0,0 +1,196 @@
+# Catálogo precalculado de puzzles de Hexa-Link.
+# Cada entrada es un (pool de 7 letras, letra central) que cumple la ventana MIN_WORDS/MAX_WORDS
+# y tiene exactamente un heptacrack. Se guarda en disco como enteros de 32 bits:
+# bits 0-26 = máscara del pool, bits 27-31 = índice de la letra central en ALFABETO.
+# Desde la versión 2 las entradas van ordenadas por dificultad y le sigue un u16 de dificultad
+# por entrada (0-65535), así cada banda de dificultad es un tramo contiguo del catálogo.
+# Desde la versión 3 la cabecera lleva la huella (SHA-1) del diccionario con el que se generó:
+# si el diccionario cambia, el catálogo deja de usarse y elegir() vuelve a la búsqueda.
+
+import hashlib
+import multiprocessing
+import os
+import struct
+from Hexa_Link.game.constants import CATALOG_FILE, WORDS_FILE, MIN_WORDS, MAX_WORDS, MIN_letras, DIFFICULTY_BANDS
+from Hexa_Link.game.word_logic import ALFABETO, BIT_LETRA, submascaras_con_centro
+from utils.lexicon import cargar_lexicon
+
+MAGIC = b"HXCT"
+VERSION = 3
+_ESCALA_DIFICULTAD = 65535
+_HEADER = struct.Struct("<4sHI")
+_HUELLA = struct.Struct("<20s")
+_BITS_MASCARA = 27
+
+_catalogo_cache = {}
+_huellas = {}
+
+
+def huella_diccionario(path=None):
+    """
+    SHA-1 de las palabras normalizadas del diccionario (no de los bytes del .txt, así no cambia
+    con los finales de línea). Se calcula una vez por versión del léxico.
+    """
+    path = os.fspath(WORDS_FILE if path is None else path)
+    lexicon = cargar_lexicon(path)
+    cache = _huellas.get(path)
+    if cache is None or cache[0] is not lexicon:
+        digest = hashlib.sha1("\n".join(lexicon.palabras()).encode("utf-8")).digest()
+        cache = _huellas[path] = (lexicon, digest)
+    return cache[1]
+
+
+def codificar_entrada(mascara_pool, idx_centro):
+    return mascara_pool | (idx_centro << _BITS_MASCARA)
+
+
+def decodificar_entrada(entrada):
+    """Devuelve (pool, center) a partir de una entrada del catálogo."""
+    mascara_pool = entrada & ((1 << _BITS_MASCARA) - 1)
+    center = ALFABETO[entrada >> _BITS_MASCARA]
+    pool = [l for l in ALFABETO if mascara_pool & BIT_LETRA[l]]
+    return pool, center
+
+
+def contar_validas(conteos, mascara_pool, bit_centro):
+    return sum(conteos.get(sub, 0) for sub in submascaras_con_centro(mascara_pool, bit_centro))
+
+
+def conteos_por_mascara(indice, min_len=MIN_letras):
+    """{máscara: cantidad de palabras con largo mínimo}; es lo único que necesitan los workers."""
+    conteos = {}
+    for m, ws in indice.items():
+        n = sum(1 for w in ws if len(w) >= min_len)
+        if n:
+            conteos[m] = n
+    return conteos
+
+
+def pools_candidatos(indice):
+    """Pools de 7 letras con exactamente un heptacrack, en orden estable."""
+    return sorted(m for m, ws in indice.items() if bin(m).count("1") == 7 and len(ws) == 1)
+
+
+def evaluar_pools(conteos, pools, min_words=MIN_WORDS, max_words=MAX_WORDS):
+    """Entradas del catálogo para cada (pool, centro) dentro de la ventana de palabras válidas."""
+    entradas = []
+    for mascara_pool in pools:
+        for idx, letra in enumerate(ALFABETO):
+            bit = BIT_LETRA[letra]
+            if mascara_pool & bit and min_words <= contar_validas(conteos, mascara_pool, bit) <= max_words:
+                entradas.append(codificar_entrada(mascara_pool, idx))
+    return entradas
+
+
+# Estado de cada proceso worker (se inicializa una vez por proceso)
+_conteos_worker = None
+
+
+def _iniciar_worker(conteos):
+    global _conteos_worker
+    _conteos_worker = conteos
+
+
+def _evaluar_shard(args):
+    pools, min_words, max_words = args
+    return evaluar_pools(_conteos_worker, pools, min_words, max_words)
+
+
+def enumerar_puzzles(indice, min_words=MIN_WORDS, max_words=MAX_WORDS, min_len=MIN_letras, procesos=1, pools=None):
+    """
+    Recorre todos los (pool, centro) posibles del índice y devuelve las entradas válidas, ordenadas.
+    Con procesos > 1 reparte los pools en shards sobre un multiprocessing.Pool; el resultado es el mismo.
+    """
+    conteos = conteos_por_mascara(indice, min_len)
+    if pools is None:
+        pools = pools_candidatos(indice)
+    if procesos <= 1 or len(pools) < 2:
+        entradas = evaluar_pools(conteos, pools, min_words, max_words)
+    else:
+        # Varios shards por proceso para repartir mejor la carga
+        n_shards = min(len(pools), procesos * 4)
+        shards = [(pools[i::n_shards], min_words, max_words) for i in range(n_shards)]
+        with multiprocessing.Pool(procesos, initializer=_iniciar_worker, initargs=(conteos,)) as pool:
+            entradas = [e for parcial in pool.map(_evaluar_shard, shards) for e in parcial]
+    entradas.sort()
+    return entradas
+
+
+def guardar_catalogo(entradas, path=None, dificultades=None, huella=None):
+    """
+    Guarda el catálogo ordenado por dificultad (valores en [0, 1]; sin dificultades quedan en 0).
+    `huella` es la de huella_diccionario() del diccionario de origen (por defecto, WORDS_FILE).
+    """
+    if path is None:
+        path = CATALOG_FILE
+    if huella is None:
+        huella = huella_diccionario()
+    if dificultades is None:
+        dificultades = [0.0] * len(entradas)
+    escaladas = [int(round(min(max(float(d), 0.0), 1.0) * _ESCALA_DIFICULTAD)) for d in dificultades]
+    pares = sorted(zip(escaladas, entradas))
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, VERSION, len(pares)))
+        f.write(_HUELLA.pack(huella))
+        f.write(struct.pack(f"<{len(pares)}I", *(e for _, e in pares)))
+        f.write(struct.pack(f"<{len(pares)}H", *(d for d, _ in pares)))
+    os.replace(tmp_path, path)
+
+
+def _leer_catalogo(path):
+    if path in _catalogo_cache:
+        return _catalogo_cache[path]
+    datos = None
+    try:
+        with open(path, "rb") as f:
+            magic, version, n = _HEADER.unpack(f.read(_HEADER.size))
+            if magic == MAGIC and version in (1, 2, VERSION):
+                huella = _HUELLA.unpack(f.read(_HUELLA.size))[0] if version >= 3 else None
+                entradas = struct.unpack(f"<{n}I", f.read(4 * n))
+                if version >= 2:
+                    dificultades = tuple(d / _ESCALA_DIFICULTAD for d in struct.unpack(f"<{n}H", f.read(2 * n)))
+                else:
+                    dificultades = (0.0,) * n
+                if entradas:
+                    datos = (entradas, dificultades, huella)
+    except (OSError, struct.error) as e:
+        if not isinstance(e, FileNotFoundError):
+            print(f"[CATALOGO] No se pudo leer {path}: {e}")
+    _catalogo_cache[path] = datos
+    return datos
+
+
+def _catalogo_vigente(path, path_palabras):
+    datos = _leer_catalogo(CATALOG_FILE if path is None else path)
+    if not datos:
+        return None
+    try:
+        vigente = datos[2] == huella_diccionario(path_palabras)
+    except OSError:
+        vigente = False
+    # Catálogo de otro diccionario (o de una versión sin huella): sus entradas no están verificadas
+    return datos if vigente else None
+
+
+def cargar_catalogo(path=None, path_palabras=None):
+    """
+    Carga el catálogo (una vez por proceso). Devuelve una tupla de entradas, o None si no existe,
+    es inválido o se generó con otro diccionario que `path_palabras` (por defecto, WORDS_FILE).
+    """
+    datos = _catalogo_vigente(path, path_palabras)
+    return datos[0] if datos else None
+
+
+def cargar_dificultades(path=None, path_palabras=None):
+    """Dificultad en [0, 1] de cada entrada, en el mismo orden que cargar_catalogo()."""
+    datos = _catalogo_vigente(path, path_palabras)
+    return datos[1] if datos else None
+
+
+def rango_banda(n, banda):
+    """Tramo [ini, fin) del catálogo (ordenado por dificultad) que corresponde a una banda de DIFFICULTY_BANDS."""
+    i = DIFFICULTY_BANDS.index(banda)
+    k = len(DIFFICULTY_BANDS)
+    ini, fin = n * i // k, n * (i + 1) // k
+    return (ini, fin) if fin > ini else (0, n)
@@ -1,25 +1,42 @@
 import pygame
 from .constants import *
 from .sound_utils import sonido_combo 
+from .word_logic import obtener_pangramas
+from utils.lexicon import mascara_letras
+
+# Multiplicador según la racha, precalculado hasta el umbral más alto de COMBO_MULTIPLIERS
+_RACHA_MAX = max(COMBO_MULTIPLIERS)
+TABLA_MULTIPLICADORES = tuple(
+    max([m for t, m in COMBO_MULTIPLIERS.items() if racha >= t] + [1.0])
+    for racha in range(_RACHA_MAX + 1)
+)
+
+def multiplicador_combo(racha):
+    return TABLA_MULTIPLICADORES[min(racha, _RACHA_MAX)]
+
 def word_valida(game_state, word):
+    mascara = mascara_letras(word)
     return (
-        word in game_state.pals_validas and
+        word in game_state.validas_set and
         game_state.letra_central in word and
         len(word) >= MIN_letras and
-        set(word) <= set(game_state.letras_base)
+        mascara is not None and
+        mascara & ~game_state.mascara_pool == 0
     )
 
 def handle_combo_and_feedback(game_state):
     combo_actual = game_state.combo_cont
     if (
         game_state.pal_actual and
-        game_state.pal_actual not in game_state.pal_encontradas and
+        game_state.pal_actual not in game_state.encontradas_set and
         word_valida(game_state, game_state.pal_actual)
     ):
         game_state.combo_cont += 1
-        mult = max([m for t, m in sorted(COMBO_MULTIPLIERS.items()) if game_state.combo_cont >= t] + [1.0])
+        mult = multiplicador_combo(game_state.combo_cont)
         game_state.score += int(len(game_state.pal_actual) * POINTS_PER_LETTER * mult)
         game_state.pal_encontradas.append(game_state.pal_actual)
+        game_state.encontradas_set.add(game_state.pal_actual)
+        game_state.trie.marcar_encontrada(game_state.pal_actual)
         game_state.mensaje_pal = ("bien!", True, pygame.time.get_ticks())
         if combo_actual < 10 and game_state.combo_cont == 10:
             sonido_combo()
@@ -30,31 +47,22 @@ def handle_combo_and_feedback(game_state):
         game_state.combo_cont = 0
         if game_state.pal_actual:
             game_state.mensaje_pal = ("no encontrada :(", False, pygame.time.get_ticks())
-    game_state.pal_actual = ""
+    game_state.clear_word()
 
 def find_heptacrack(game_state):
-    pool = set(game_state.letras_base)
-    for w in game_state.pals_validas:
-        if set(w) == pool and all(w.count(l) >= 1 for l in pool) and len(w) >= 7:
+    for w in obtener_pangramas().get(game_state.mascara_pool, ()):
+        if w in game_state.validas_set:
             return w
     return None
 
 def forzar_heptacrack(game_state):
-    pool = set(game_state.letras_base)
-    heptacracks = [w for w in game_state.pals_validas if set(w) == pool and all(w.count(l) >= 1 for l in pool) and len(w) >= 7]
-    if not heptacracks:
-        from Hexa_Link.game.constants import WORDS_FILE
-        with open(WORDS_FILE, encoding="utf-8") as f:
-            for line in f:
-                w = line.strip().upper()
-                if set(w) == pool and all(w.count(l) >= 1 for l in pool) and len(w) >= 7:
-                    game_state.pals_validas.append(w)
-                    game_state.por_inicial.setdefault(w[0], []).append(w)
-                    game_state._heptacrack = w
-                    break
-    else:
+    mascara_pool = mascara_letras("".join(game_state.letras_base))
+    pangramas = obtener_pangramas().get(mascara_pool, [])
+    validas = set(game_state.pals_validas)
+    heptacracks = [w for w in pangramas if w in validas]
+    if heptacracks:
         game_state._heptacrack = heptacracks[0]
-        game_state.pals_validas = [w for w in game_state.pals_validas if w != game_state._heptacrack or w == heptacracks[0]]
-        game_state.por_inicial = {}
-        for w in game_state.pals_validas:
-            game_state.por_inicial.setdefault(w[0], []).append(w)
+    elif pangramas:
+        # El pool no trae su heptacrack entre las válidas: se agrega desde el índice (sin leer el archivo)
+        game_state._heptacrack = pangramas[0]
+        game_state.pals_validas.append(pangramas[0])
@@ -220,9 +220,10 @@ def draw_pause_screen(screen, mouse_pos):
 
 
 # === ELEMENTOS DE HUD Y MENSAJES ===
-def draw_pal_actual(screen, pal_actual):
-    """Dibuja la palabra que el usuario está formando actualmente."""
-    curr_txt = FONT_MEDIUM.render(pal_actual.upper(), True, TEXT_COLOR)
+def draw_pal_actual(screen, pal_actual, pendientes=None):
+    """Dibuja la palabra que el usuario está formando; en rojo si ya no lleva a ninguna palabra pendiente."""
+    color = ERROR_COLOR if pal_actual and pendientes == 0 else TEXT_COLOR
+    curr_txt = FONT_MEDIUM.render(pal_actual.upper(), True, color)
     screen.blit(curr_txt, (GAME_AREA_WIDTH // 2 - curr_txt.get_width() // 2, HEIGHT - 280))
 
 
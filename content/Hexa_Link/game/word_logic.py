@@ -1,42 +1,146 @@
 import os
+import json
 import random
-from Hexa_Link.game.constants import WORDS_FILE
+from Hexa_Link.game.constants import WORDS_FILE, MIN_WORDS, MAX_WORDS, MIN_letras, DAILY_PUZZLE_FILE, DIFFICULTY_BAND
 from collections import Counter
+from utils.lexicon import ALFABETO, BIT_LETRA, mascara_letras, cargar_lexicon
+from utils.semillas import semilla_diaria
+
+_indice_cache = {}
+_puzzles_por_semilla = {}
+
 
 def cargar_pals(path=None):
     if path is None:
         path = WORDS_FILE
-    with open(path, "r", encoding="utf-8") as f:
-        return [w.strip().strip('"').lower() for w in f if w.strip()]
-
-def elegir():
-    palabras_completo = cargar_pals()
-    # Buscar palabras que usen SOLO las 7 letras (con posibles repeticiones) y contengan todas
-    heptacracks = [w for w in palabras_completo if len(w) >= 7 and set(w) == set(w) and len(set(w)) == 7]
-    random.shuffle(heptacracks)
-    for heptacrack in palabras_completo:
+    return list(cargar_lexicon(path).palabras())
+
+
+def _cargar_indices(path=None):
+    if path is None:
+        path = WORDS_FILE
+    lexicon = cargar_lexicon(path)
+    cache = _indice_cache.get(path)
+    if cache is None or cache[0] is not lexicon:
+        # Las máscaras ya vienen precalculadas en el léxico compilado
+        indice = {}
+        vistas = set()
+        for i, w in enumerate(lexicon.palabras()):
+            m = lexicon.mascara(i)
+            if m is not None and w not in vistas:
+                vistas.add(w)
+                indice.setdefault(m, []).append(w)
+        # Índice de pangramas: palabras con exactamente 7 letras distintas, por máscara
+        pangramas = {m: ws for m, ws in indice.items() if bin(m).count("1") == 7}
+        cache = _indice_cache[path] = (lexicon, indice, pangramas)
+    return cache
+
+
+def obtener_indice(path=None):
+    """Índice por máscara del diccionario; se reconstruye solo si cambia el archivo de palabras."""
+    return _cargar_indices(path)[1]
+
+
+def obtener_pangramas(path=None):
+    """Índice {máscara de 7 letras: [heptacracks]} construido junto con el índice por máscara."""
+    return _cargar_indices(path)[2]
+
+
+def submascaras_con_centro(mascara_pool, bit_centro):
+    """Enumera las submáscaras del pool que contienen la letra central (64 para un pool de 7 letras)."""
+    resto = mascara_pool & ~bit_centro
+    sub = resto
+    while True:
+        yield sub | bit_centro
+        if sub == 0:
+            break
+        sub = (sub - 1) & resto
+
+
+def buscar_validas(indice, pool, center, min_len=MIN_letras):
+    """Palabras del índice que usan solo letras del pool, contienen la central y tienen largo mínimo."""
+    mascara_pool = mascara_letras("".join(pool))
+    valid = []
+    for sub in submascaras_con_centro(mascara_pool, BIT_LETRA[center]):
+        for w in indice.get(sub, ()):
+            if len(w) >= min_len:
+                valid.append(w)
+    return valid
+
+
+def elegir_de_catalogo(catalogo, indice, rng=random, banda=None):
+    """
+    Elige un puzzle precalculado por índice aleatorio; solo falta resolver sus palabras válidas.
+    Con `banda` el índice se toma dentro del tramo de esa dificultad (el catálogo viene ordenado).
+    """
+    from Hexa_Link.game.puzzle_catalog import decodificar_entrada, rango_banda
+    ini, fin = rango_banda(len(catalogo), banda) if banda else (0, len(catalogo))
+    pool, center = decodificar_entrada(catalogo[rng.randrange(ini, fin)])
+    rng.shuffle(pool)
+    return pool, center, buscar_validas(indice, pool, center)
+
+
+def elegir(seed=None, banda=None):
+    """
+    Elige un puzzle (pool, center, valid). Con la misma `seed` (y el mismo diccionario/catálogo)
+    siempre devuelve el mismo puzzle; sin seed usa el generador global de random.
+    `banda` ("facil", "media", "dificil") filtra por dificultad; por defecto se usa DIFFICULTY_BAND.
+    Solo aplica cuando existe el catálogo (generado con el diccionario actual), que es el que trae
+    la dificultad precalculada.
+    """
+    from Hexa_Link.game.puzzle_catalog import cargar_catalogo
+    rng = random if seed is None else random.Random(seed)
+    indice = obtener_indice()
+    catalogo = cargar_catalogo()
+    if catalogo:
+        return elegir_de_catalogo(catalogo, indice, rng, banda or DIFFICULTY_BAND)
+    # Heptacracks candidatos: máscaras con exactamente 7 letras distintas
+    heptacracks = [w for ws in obtener_pangramas().values() for w in ws]
+    rng.shuffle(heptacracks)
+    for heptacrack in heptacracks:
         unique_letras = set(heptacrack)
-        if len(heptacrack) >= 7 and len(unique_letras) == 7:
-            pool = list(unique_letras)
-            center = random.choice(pool)
-            # Palabras válidas: usan solo letras del pool
-            valid = list({
-                w for w in palabras_completo
-                if center in w and len(w) >= 3 and set(w) <= unique_letras
-            })
-            # El heptacrack debe ser la única palabra válida que use todas las 7 letras (con repeticiones permitidas)
-            heptacracks_in_valid = [w for w in valid if set(w) == unique_letras and all(w.count(l) >= 1 for l in unique_letras) and len(w) >= 7]
-            if len(heptacracks_in_valid) == 1 and 50 <= len(valid) <= 100:
-                print(f"Palabras válidas ({len(valid)}): {valid}")
-                return pool, center, valid
+        pool = sorted(unique_letras)  # Orden estable: el de un set depende del hash del proceso
+        rng.shuffle(pool)
+        center = rng.choice(pool)
+        valid = buscar_validas(indice, pool, center)
+        # El heptacrack debe ser la única palabra válida que use todas las 7 letras (con repeticiones permitidas)
+        heptacracks_in_valid = indice[mascara_letras(heptacrack)]
+        if len(heptacracks_in_valid) == 1 and MIN_WORDS <= len(valid) <= MAX_WORDS:
+            print(f"Palabras válidas ({len(valid)}): {valid}")
+            return pool, center, valid
     # Fallback: lógica anterior
     while True:
-        pool = random.sample(list("abcdefghijklmnopqrstuvwxyz"), 7)
-        center = random.choice(pool)
-        valid = list({
-            w for w in palabras_completo
-            if center in w and len(w) >= 3 and set(w) <= set(pool)
-        })
-        if 50 <= len(valid) <= 100:
+        pool = rng.sample(list("abcdefghijklmnopqrstuvwxyz"), 7)
+        center = rng.choice(pool)
+        valid = buscar_validas(indice, pool, center)
+        if MIN_WORDS <= len(valid) <= MAX_WORDS:
             print(f"Palabras válidas ({len(valid)}): {valid}")
-            return pool, center, valid
\ No newline at end of file
+            return pool, center, valid
+
+
+def generar_puzzle(seed):
+    """Puzzle determinista para una semilla; se genera una sola vez por proceso y se devuelven copias."""
+    if seed not in _puzzles_por_semilla:
+        pool, center, valid = elegir(seed)
+        _puzzles_por_semilla[seed] = (tuple(pool), center, tuple(valid))
+    pool, center, valid = _puzzles_por_semilla[seed]
+    return list(pool), center, list(valid)
+
+
+def puzzle_diario(fecha=None, path=DAILY_PUZZLE_FILE):
+    """Puzzle del día: igual para todos los jugadores y guardado en disco para no regenerarlo en cada partida."""
+    seed = semilla_diaria(fecha)
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("seed") == seed:
+            return list(data["pool"]), data["center"], list(data["valid"])
+    except (OSError, ValueError, KeyError):
+        pass
+    pool, center, valid = generar_puzzle(seed)
+    try:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"seed": seed, "pool": pool, "center": center, "valid": valid}, f, ensure_ascii=False)
+    except OSError as e:
+        print(f"[DIARIO] No se pudo guardar el puzzle diario: {e}")
+    return pool, center, valid
@@ -3,6 +3,7 @@ import os
 import json
 from .game.main_game import HexGame
 from .game.game_state import GameState
+from .game.word_logic import puzzle_diario
 
 SAVES_DIR = os.path.join(os.path.dirname(__file__), "saves")
 
@@ -32,9 +33,10 @@ def load_game_state(usuario):
         return None
 
 
-def iniciar_hexalink(usuario, cargar=False):
+def iniciar_hexalink(usuario, cargar=False, diario=False):
     game_state = None
-    if cargar:
+    puzzle = puzzle_diario() if diario else None
+    if cargar and not diario:
         try:
             game_state = load_game_state(usuario)
             if not game_state:
@@ -46,10 +48,15 @@ def iniciar_hexalink(usuario, cargar=False):
         if game_state:
             game = HexGame(usuario=usuario, game_state=game_state)
         else:
-            game = HexGame(usuario=usuario)
+            game = HexGame(usuario=usuario, puzzle=puzzle, diario=diario)
     except Exception:
         return  # No cerrar el programa abruptamente
 
+    if diario:
+        # El puzzle diario no pisa la partida guardada del jugador
+        game.run()
+        return
+
     # Hook para guardar al salir
     original_run = game.run
 
@@ -63,5 +70,5 @@ def iniciar_hexalink(usuario, cargar=False):
 
 if __name__ == "__main__":
     usuario = sys.argv[1] if len(sys.argv) > 1 else "default"
-    cargar = sys.argv[2] == "cargar" if len(sys.argv) > 2 else False
-    iniciar_hexalink(usuario, cargar=cargar)
\ No newline at end of file
+    modo = sys.argv[2] if len(sys.argv) > 2 else "nueva"
+    iniciar_hexalink(usuario, cargar=modo == "cargar", diario=modo == "diario")
\ No newline at end of file
@@ -0,0 +1,70 @@
+"""
+Benchmark de la generación de tableros de Lexigrama.
+
+Uso (desde la carpeta content):
+    python -m lexigrama_game.bench [--motores greedy backtracking] [--tableros N] [--semilla S]
+                                   [--presets normal grande enorme gigante]
+
+Genera los mismos N tableros (misma serie de semillas) con cada motor de colocación y compara
+tasa de éxito, latencia (media y p95) y nodos del motor por tablero, para cada tamaño de tablero
+de GameSettings.GRID_PRESETS pedido
+(greedy: colocaciones probadas; backtracking: palabras escritas en el tablero, incluidas las deshechas).
+"""
+import argparse
+import contextlib
+import io
+import statistics
+import time
+
+from .config.settings import GameSettings
+from .game.word_generator import WordGenerator
+
+MOTORES = ("greedy", "backtracking")
+
+
+def medir_motor(motor, tableros, semilla, settings=None):
+    """Genera `tableros` tableros con el motor dado y devuelve las métricas agregadas."""
+    settings = settings or GameSettings()
+    settings.PLACEMENT_ENGINE = motor
+    generador = WordGenerator(settings)
+    generador._cargar_pals_from_file(settings.WORD_FILE)  # La carga no cuenta en la latencia
+    tiempos, nodos, exitos = [], [], 0
+    for i in range(tableros):
+        inicio = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):  # Silenciar la distribución de palabras
+            tablero = generador.generate_game_board(semilla + i)
+        tiempos.append(time.perf_counter() - inicio)
+        nodos.append(generador.get_generation_stats().placement_nodes)
+        exitos += tablero is not None
+    tiempos.sort()
+    return {
+        "motor": motor,
+        "exito": exitos / tableros if tableros else 0.0,
+        "media_ms": statistics.fmean(tiempos) * 1000 if tiempos else 0.0,
+        "p95_ms": tiempos[min(len(tiempos) - 1, int(len(tiempos) * 0.95))] * 1000 if tiempos else 0.0,
+        "nodos": statistics.fmean(nodos) if nodos else 0.0,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compara los motores de colocación de Lexigrama.")
+    parser.add_argument("--motores", nargs="+", choices=MOTORES, default=list(MOTORES), help="Motores a comparar.")
+    parser.add_argument("--tableros", type=int, default=50, help="Tableros a generar por motor.")
+    parser.add_argument("--semilla", type=int, default=0, help="Primera semilla de la serie.")
+    parser.add_argument("--presets", nargs="+", choices=list(GameSettings.GRID_PRESETS),
+                        default=[GameSettings.GRID_PRESET], help="Tamaños de tablero a medir.")
+    args = parser.parse_args(argv)
+
+    for preset in args.presets:
+        for motor in args.motores:
+            settings = GameSettings()
+            settings.apply_grid_preset(preset)
+            m = medir_motor(motor, args.tableros, args.semilla, settings)
+            filas, columnas = settings.GRID_SIZE
+            print(f"[BENCH] {preset:<8} {filas:>2}x{columnas:<2} {settings.TARGET_WORDS_COUNT:>2} palabras  "
+                  f"{m['motor']:<12} éxito {m['exito']:6.1%}  media {m['media_ms']:8.2f} ms  "
+                  f"p95 {m['p95_ms']:8.2f} ms  nodos {m['nodos']:8.1f}")
+
+
+if __name__ == "__main__":
+    main()
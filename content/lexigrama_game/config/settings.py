@@ -9,13 +9,45 @@ class GameSettings:
     GRID_SIZE = (5, 6)
     TARGET_WORDS_COUNT = 7
     WORD_DISTRIBUTION = {9: 1, 8: 1, 7: 1, 6: 2, 5: 2}
+    # Tamaños de tablero disponibles (el primero es el de arriba); se aplican con apply_grid_preset()
+    GRID_PRESET = "normal"
+    GRID_PRESETS = {
+        "normal": {"GRID_SIZE": (5, 6), "TARGET_WORDS_COUNT": 7, "WORD_DISTRIBUTION": {9: 1, 8: 1, 7: 1, 6: 2, 5: 2}},
+        "grande": {"GRID_SIZE": (8, 8), "TARGET_WORDS_COUNT": 14, "WORD_DISTRIBUTION": {9: 2, 8: 2, 7: 3, 6: 3, 5: 4}},
+        "enorme": {"GRID_SIZE": (10, 10), "TARGET_WORDS_COUNT": 20, "WORD_DISTRIBUTION": {9: 3, 8: 3, 7: 4, 6: 5, 5: 5}},
+        "gigante": {"GRID_SIZE": (12, 12), "TARGET_WORDS_COUNT": 26, "WORD_DISTRIBUTION": {9: 4, 8: 4, 7: 5, 6: 6, 5: 7}},
+    }
     MAX_REPLACEMENTS_PER_SLOT = 100
     MAX_GLOBAL_GENERATION_ATTEMPTS = 30
     MAX_INTERNAL_BOARD_ATTEMPTS = 20
+    # Motor de colocación: "greedy" (voraz, reinicia si una ranura falla) o "backtracking" (con retroceso)
+    PLACEMENT_ENGINE = "greedy"
+    MAX_PLACEMENT_NODES = 100     # Presupuesto del motor con retroceso por búsqueda: palabras escritas...
+    MAX_PLACEMENT_STEPS = 20000   # ...y celdas visitadas buscando caminos
+    # Palabras del diccionario que se forman en el tablero sin ser objetivo (solver tipo Boggle)
+    SOLVER_MIN_WORD_LENGTH = 4
+    MAX_ACCIDENTAL_WORDS = None  # None = sin límite; si se supera, el tablero se descarta
+    # Generación en paralelo: reparte los intentos globales en un pool de procesos (gana el primero)
+    PARALLEL_GENERATION = False
+    GENERATION_WORKERS = None  # None = os.cpu_count()
     WORD_FILE = BASE_DIR / "palabras.txt"
     
     SAVES_DIR = BASE_DIR / "saves" 
     SAVE_FILE_NAME = SAVES_DIR / "partidas_guardadas.json"
+    # Reserva de tableros pregenerados (se invalida sola si cambia la configuración o el archivo de palabras)
+    BOARD_POOL_FILE = SAVES_DIR / "tableros_reserva.json"
+    BOARD_POOL_SIZE = 3
+    # Archivo JSON lines donde se registran las estadísticas de cada generación (None = no registrar),
+    # por ejemplo SAVES_DIR / "generacion.jsonl"
+    GENERATION_STATS_LOG = None
+
+    def apply_grid_preset(self, name: str):
+        """Aplica un tamaño de GRID_PRESETS (tablero, cantidad y distribución de palabras) a esta configuración."""
+        preset = self.GRID_PRESETS[name]
+        self.GRID_SIZE = tuple(preset["GRID_SIZE"])
+        self.TARGET_WORDS_COUNT = preset["TARGET_WORDS_COUNT"]
+        self.WORD_DISTRIBUTION = dict(preset["WORD_DISTRIBUTION"])
+        self.GRID_PRESET = name
 
 
 class UISettings:
@@ -25,6 +57,10 @@ class UISettings:
     UI_FONT_SIZE = 15
     LOGO_MAX_WIDTH = 500
     LOGO_MAX_HEIGHT = 300
+    GENERATION_POLL_MS = 100  # Cada cuánto el menú revisa si terminó la generación del tablero
+    # Cómo se dibuja el tablero: "buttons" (un tk.Button por celda) o "canvas" (un solo tk.Canvas,
+    # más liviano en tableros grandes)
+    BOARD_BACKEND = "buttons"
     
     # Rutas construidas usando RECURSOS_DIR_GENERAL
     LOGO_PATH = RECURSOS_DIR_GENERAL / "lexigrama.png"
@@ -0,0 +1,171 @@
+# game/board_pool.py
+import copy
+import hashlib
+import json
+import os
+import threading
+from typing import List, Tuple, Optional, Dict
+
+from .word_generator import WordGenerator
+
+# Hash del contenido de cada archivo de palabras, por (ruta, mtime, tamaño): se calcula una vez por versión
+_HASH_POR_ARCHIVO: Dict[Tuple[str, float, int], str] = {}
+
+
+def _hash_archivo(path: str) -> str:
+    st = os.stat(path)
+    clave = (path, st.st_mtime, st.st_size)
+    digest = _HASH_POR_ARCHIVO.get(clave)
+    if digest is None:
+        h = hashlib.sha1()
+        with open(path, "rb") as f:
+            for bloque in iter(lambda: f.read(1 << 20), b""):
+                h.update(bloque)
+        digest = _HASH_POR_ARCHIVO[clave] = h.hexdigest()
+    return digest
+
+
+class BoardPool:
+    """
+    Reserva en disco de tableros ya generados, para que "Nueva Partida" arranque al instante.
+    Un hilo en segundo plano la rellena hasta `size` tableros. Cada reserva lleva una clave
+    (hash de la configuración de generación y del archivo de palabras): si cualquiera de los dos
+    cambia, los tableros guardados se descartan solos.
+    El hilo nunca lee la configuración viva del juego: genera con una copia tomada por
+    fill_in_background(), y pause() lo detiene mientras se juega una partida.
+    """
+
+    def __init__(self, game_settings, path: Optional[str] = None, size: Optional[int] = None):
+        self.game_settings = game_settings
+        self.path = str(path if path is not None else game_settings.BOARD_POOL_FILE)
+        self.size = size if size is not None else game_settings.BOARD_POOL_SIZE
+        self._lock = threading.Lock()
+        self._filler: Optional[threading.Thread] = None
+        # Última copia de la configuración pedida por el juego, con su clave: (configuración, clave)
+        self._snapshot: Optional[Tuple[object, str]] = None
+        self._running = threading.Event()  # Sin activar: el relleno espera (hay una partida en curso)
+        self._running.set()
+
+    def settings_key(self, settings=None) -> str:
+        """Clave de la configuración (la actual si no se indica): tamaño, distribución, intentos y archivo de palabras."""
+        gs = settings if settings is not None else self.game_settings
+        datos = {
+            "grid": list(gs.GRID_SIZE),
+            "targets": gs.TARGET_WORDS_COUNT,
+            "distribution": sorted(gs.WORD_DISTRIBUTION.items()),
+            "replacements": gs.MAX_REPLACEMENTS_PER_SLOT,
+            "engine": gs.PLACEMENT_ENGINE,
+            "accidental": [gs.SOLVER_MIN_WORD_LENGTH, gs.MAX_ACCIDENTAL_WORDS],
+            "word_file": _hash_archivo(str(gs.WORD_FILE)),
+        }
+        return hashlib.sha1(json.dumps(datos, sort_keys=True).encode("utf-8")).hexdigest()
+
+    def _read(self, key: str) -> Dict:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            data = {}
+        if data.get("key") != key:
+            data = {"key": key, "boards": []}  # Configuración o palabras distintas: se invalida la reserva
+        data.setdefault("boards", [])
+        return data
+
+    def _write(self, data: Dict):
+        # Escritura atómica: el juego y el hilo de relleno comparten el archivo
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+
+    def take(self) -> Optional[Tuple[List[List[str]], List[str]]]:
+        """Saca un tablero (tablero, palabras objetivo) de la reserva, o None si no hay ninguno válido."""
+        try:
+            key = self.settings_key()
+        except OSError:
+            return None
+        with self._lock:
+            data = self._read(key)
+            if not data["boards"]:
+                return None
+            entry = data["boards"].pop(0)
+            try:
+                self._write(data)
+            except OSError as e:
+                print(f"Advertencia: No se pudo actualizar la reserva de tableros: {e}")
+        return entry["board"], entry["words"]
+
+    def available(self) -> int:
+        """Cantidad de tableros listos para la configuración actual."""
+        try:
+            key = self.settings_key()
+        except OSError:
+            return 0
+        with self._lock:
+            return len(self._read(key)["boards"])
+
+    def _fill(self):
+        # Generador propio (el del juego guarda estado de la partida en curso), con la copia de la configuración
+        generator = None
+        while True:
+            self._running.wait()
+            with self._lock:
+                settings, key = self._snapshot
+                if len(self._read(key)["boards"]) >= self.size:
+                    self._filler = None # Dentro del lock: un pedido posterior arranca otro hilo
+                    return
+            if generator is None or generator.game_settings is not settings:
+                generator = WordGenerator(settings)
+            # La generación corre fuera del lock para no bloquear a take()
+            board = generator.generate_game_board()
+            if board is None:
+                return
+            with self._lock:
+                if self._snapshot[1] != key:
+                    continue # La configuración cambió mientras se generaba (p. ej. otro tamaño de tablero)
+                data = self._read(key)
+                if len(data["boards"]) >= self.size:
+                    self._filler = None
+                    return
+                data["boards"].append({"board": board, "words": list(generator.get_target_words())})
+                try:
+                    self._write(data)
+                except OSError as e:
+                    print(f"Advertencia: No se pudo guardar la reserva de tableros: {e}")
+                    return
+
+    def _run_filler(self):
+        try:
+            self._fill()
+        except OSError as e:
+            print(f"Advertencia: No se pudo rellenar la reserva de tableros: {e}")
+        finally:
+            with self._lock:
+                if self._filler is threading.current_thread():
+                    self._filler = None
+
+    def pause(self):
+        """Detiene el relleno (al terminar el tablero en curso) hasta el próximo fill_in_background()."""
+        self._running.clear()
+
+    def fill_in_background(self) -> Optional[threading.Thread]:
+        """
+        Rellena la reserva hasta `size` tableros en un hilo, con una copia de la configuración actual.
+        Llamarlo desde el hilo que modifica la configuración (el de Tk), así la copia nunca queda a medias.
+        """
+        if self.size <= 0:
+            return None
+        try:
+            snapshot = copy.deepcopy(self.game_settings)
+            key = self.settings_key(snapshot)
+        except OSError as e:
+            print(f"Advertencia: No se pudo preparar la reserva de tableros: {e}")
+            return None
+        with self._lock:
+            self._snapshot = (snapshot, key)
+            self._running.set()
+            if self._filler is None:
+                self._filler = threading.Thread(target=self._run_filler, name="lexigrama-reserva", daemon=True)
+                self._filler.start()
+            return self._filler
@@ -0,0 +1,83 @@
+# game/board_solver.py
+from typing import List, Tuple, Optional, Dict, Iterable
+
+from utils.lexicon import cargar_lexicon
+from .grid import tabla_vecinos
+
+# Clave de los nodos del trie que terminan una palabra (guarda la palabra completa)
+_FIN = ""
+
+# Tries por archivo y largo mínimo, cargados una vez por proceso: {(ruta, largo mínimo): (léxico, trie)}
+_TRIES_POR_ARCHIVO: Dict[Tuple[str, int], Tuple[object, Dict]] = {}
+
+
+def construir_trie(words: Iterable[str], min_length: int) -> Dict:
+    """Trie de diccionarios anidados {letra: nodo}; el nodo final guarda la palabra en la clave _FIN."""
+    root: Dict = {}
+    for word in words:
+        if len(word) < min_length:
+            continue
+        node = root
+        for letter in word:
+            node = node.setdefault(letter, {})
+        node[_FIN] = word
+    return root
+
+
+class BoardSolver:
+    """
+    Encuentra todas las palabras del diccionario que se pueden formar en un tablero
+    siguiendo caminos ortogonales sin repetir celdas (como en Boggle).
+    Recorre el tablero con un DFS que avanza por el trie de prefijos y lleva las celdas
+    usadas en un bitboard, así cada rama muere apenas deja de ser prefijo de alguna palabra.
+    """
+    def __init__(self, game_settings):
+        self.game_settings = game_settings
+
+    def _get_trie(self) -> Optional[Dict]:
+        filename = str(self.game_settings.WORD_FILE)
+        min_length = self.game_settings.SOLVER_MIN_WORD_LENGTH
+        try:
+            lexicon = cargar_lexicon(filename)
+        except FileNotFoundError:
+            print(f"Error Crítico: No se encontró el archivo de palabras '{filename}'.")
+            return None
+        cache = _TRIES_POR_ARCHIVO.get((filename, min_length))
+        if cache is None or cache[0] is not lexicon:
+            trie = construir_trie(dict.fromkeys(w.upper() for w in lexicon.palabras()), min_length)
+            cache = _TRIES_POR_ARCHIVO[(filename, min_length)] = (lexicon, trie)
+        return cache[1]
+
+    def solve(self, board: List[List[str]]) -> Dict[str, List[Tuple[int, int]]]:
+        """Devuelve {palabra: camino} con un camino (lista de (fila, columna)) por cada palabra del tablero."""
+        trie = self._get_trie()
+        if not trie or not board or not board[0]:
+            return {}
+        rows, cols = len(board), len(board[0])
+        vecinos, coords = tabla_vecinos(rows, cols)
+        letters = [board[r][c] for r, c in coords]
+        found: Dict[str, List[Tuple[int, int]]] = {}
+        path: List[int] = []
+
+        def visit(cell: int, node: Dict, used: int):
+            path.append(cell)
+            word = node.get(_FIN)
+            if word is not None and word not in found:
+                found[word] = [coords[i] for i in path]
+            for siguiente in vecinos[cell]:
+                if not used >> siguiente & 1:
+                    child = node.get(letters[siguiente])
+                    if child is not None:
+                        visit(siguiente, child, used | 1 << siguiente)
+            path.pop()
+
+        for cell, letter in enumerate(letters):
+            node = trie.get(letter)
+            if node is not None:
+                visit(cell, node, 1 << cell)
+        return found
+
+    def accidental_words(self, board: List[List[str]], target_words: Iterable[str]) -> List[str]:
+        """Palabras del diccionario que aparecen en el tablero sin ser palabras objetivo."""
+        targets = set(target_words)
+        return sorted(w for w in self.solve(board) if w not in targets)
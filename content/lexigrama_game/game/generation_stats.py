@@ -0,0 +1,65 @@
+# game/generation_stats.py
+import json
+import os
+import time
+from typing import List, Optional, Dict, Any
+
+
+class GenerationStats:
+    """
+    Contadores y tiempos de una llamada a WordGenerator.generate_game_board().
+    Los tiempos están en segundos. `replacements_per_slot` es del último intento global y solo
+    lo llena el motor voraz (el motor con retroceso reporta sus nodos en `placement_nodes`).
+    """
+    def __init__(self, engine: str = "", grid_size=(0, 0), seed: Optional[int] = None):
+        self.engine = engine
+        self.grid_size = tuple(grid_size)
+        self.seed = seed
+        self.success = False
+        self.global_attempts = 0
+        self.lexicon_load_time = 0.0
+        self.selection_time = 0.0
+        self.placement_time = 0.0
+        self.fill_time = 0.0
+        self.total_time = 0.0
+        self.dfs_nodes = 0          # Celdas visitadas por los DFS de búsqueda de caminos
+        self.paths_rejected = 0     # Búsquedas de camino que terminaron sin camino
+        self.placement_nodes = 0    # Colocaciones probadas (voraz) o palabras escritas (retroceso)
+        self.replacements_total = 0
+        self.replacements_per_slot: List[int] = []
+        self.boards_rejected_accidental = 0  # Tableros descartados por MAX_ACCIDENTAL_WORDS
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = dict(vars(self))
+        data["grid_size"] = list(self.grid_size)
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "GenerationStats":
+        stats = cls()
+        for key, value in data.items():
+            if hasattr(stats, key):
+                setattr(stats, key, value)
+        stats.grid_size = tuple(stats.grid_size)
+        return stats
+
+    def acumular(self, other: "GenerationStats"):
+        """Suma los contadores y tiempos de otra generación (p. ej. de otro proceso) a estos."""
+        for key in ("global_attempts", "lexicon_load_time", "selection_time", "placement_time",
+                    "fill_time", "dfs_nodes", "paths_rejected", "placement_nodes",
+                    "replacements_total", "boards_rejected_accidental"):
+            setattr(self, key, getattr(self, key) + getattr(other, key))
+
+    def log_json_line(self, path):
+        """Agrega las estadísticas como una línea JSON (con fecha) al archivo indicado."""
+        try:
+            os.makedirs(os.path.dirname(os.fspath(path)) or ".", exist_ok=True)
+            with open(path, "a", encoding="utf-8") as f:
+                f.write(json.dumps({"timestamp": time.time(), **self.to_dict()}, ensure_ascii=False) + "\n")
+        except OSError as e:
+            print(f"Advertencia: No se pudieron registrar las estadísticas de generación: {e}")
+
+    def __repr__(self) -> str:
+        return (f"GenerationStats(success={self.success}, attempts={self.global_attempts}, "
+                f"total={self.total_time * 1000:.1f} ms, dfs_nodes={self.dfs_nodes}, "
+                f"paths_rejected={self.paths_rejected}, replacements={self.replacements_total})")
@@ -0,0 +1,20 @@
+# game/grid.py
+from typing import Dict, Tuple
+
+# Tablas de vecinos ortogonales por tamaño de tablero: {(filas, columnas): (vecinos, coordenadas)}
+# Las celdas se numeran como fila * columnas + columna.
+_VECINOS_POR_TAMANO: Dict[Tuple[int, int], Tuple[Tuple[Tuple[int, ...], ...], Tuple[Tuple[int, int], ...]]] = {}
+
+
+def tabla_vecinos(rows: int, cols: int):
+    """Devuelve (y cachea) los vecinos de cada celda y la coordenada (fila, columna) de cada índice."""
+    tabla = _VECINOS_POR_TAMANO.get((rows, cols))
+    if tabla is None:
+        vecinos = []
+        for r in range(rows):
+            for c in range(cols):
+                vecinos.append(tuple(nr * cols + nc for nr, nc in ((r - 1, c), (r + 1, c), (r, c - 1), (r, c + 1))
+                                     if 0 <= nr < rows and 0 <= nc < cols))
+        coords = tuple((i // cols, i % cols) for i in range(rows * cols))
+        tabla = _VECINOS_POR_TAMANO[(rows, cols)] = (tuple(vecinos), coords)
+    return tabla
@@ -1,16 +1,21 @@
 import tkinter as tk
 from tkinter import PhotoImage
 from typing import List, Tuple, Set, Optional
-from PIL import Image, ImageTk
 
 import os 
 import json
+import queue
+import threading
+import time
 import pygame
 
+from utils.image_cache import foto_tk
 from ..config.settings import GameSettings, UISettings
 from ..utils.sound_manager import SoundManager
 from ..utils.score_manager import ScoreManager
-from .word_generator import WordGenerator
+from .word_generator import WordGenerator, cerrar_pool_generacion
+from .board_pool import BoardPool
+from .board_solver import BoardSolver
 from ..ui.menu_ui import MenuUI
 from ..ui.game_ui import GameUI
 
@@ -48,6 +53,11 @@ class LexigramaGame:
         self.sound_manager.start_music()
 
         self.word_generator = WordGenerator(game_settings=self.game_settings)
+        self.board_pool = BoardPool(self.game_settings)
+        self.board_solver = BoardSolver(self.game_settings)
+        # Palabras formables en el tablero actual, calculadas al primer uso: (tablero, palabras)
+        self._board_words: Tuple[Optional[List[List[str]]], Set[str]] = (None, set())
+        self.board_pool.fill_in_background()
 
         self.menu_ui = MenuUI(
             self.root, self.ui_settings,
@@ -56,8 +66,10 @@ class LexigramaGame:
             on_back_menu=self._back_to_menu_action,
             on_how_to_play_menu_click=lambda: self._create_how_to_play_window("Como Jugar Lexigrama"),
             on_load_game=self._load_game_action,
-            on_show_scores=self._show_scores_window
+            on_show_scores=self._show_scores_window,
+            on_grid_preset_toggle=self._cycle_grid_preset
         ) 
+        self._update_grid_preset_button()
 
         self.game_ui = GameUI(self.root, self.ui_settings,
                                 on_cell_click=self._on_grid_cell_click,
@@ -69,6 +81,8 @@ class LexigramaGame:
                                 on_back_to_menu_and_save=self._back_to_menu_and_save_action)
         self._timer_after_id: Optional[str] = None
         self._message_after_id: Optional[str] = None
+        # Generación del tablero en segundo plano (el resultado llega por la cola)
+        self._generation_thread: Optional[threading.Thread] = None
 
         # --- Inicialización de la Interfaz ---
         self.current_board: Optional[List[List[str]]] = None
@@ -106,6 +120,7 @@ class LexigramaGame:
         self.sound_manager.start_music()
         self.menu_ui.enable_start_button() 
         self.menu_ui.update_music_button_text(self.sound_manager.get_music_status_text())
+        self.board_pool.fill_in_background()
         self._show_message("", 1)
         if not self.username:
              print("Advertencia: Nombre de usuario no establecido al mostrar menú. El guardado/carga podría no funcionar como se espera.")
@@ -121,6 +136,7 @@ class LexigramaGame:
     def _back_to_menu_action(self):
         """Acción de 'Volver' al menú de selección de juegos, sin guardar ni advertir."""
         self.sound_manager.stop_music()
+        cerrar_pool_generacion()
         self.root.destroy()
         from menus.seleccion_juego import iniciar_menu
         iniciar_menu(self.username)
@@ -249,6 +265,7 @@ class LexigramaGame:
         """Reanuda el juego con el estado cargado."""
         self.game_active = True
         self.timer_running = True 
+        self.board_pool.pause()
         
         if not self.current_board: 
             self._show_message("Error: Tablero no disponible al cargar.", 3000)
@@ -258,11 +275,7 @@ class LexigramaGame:
         self.game_ui.display_board(self.current_board, self.current_selection_path) 
         self.game_ui.set_entry_text(self.current_selected_word) 
 
-        palabras_por_longitud_para_ui = {}
-        for palabra_str in self.palabras_objetivo:
-            longitud = len(palabra_str)
-            palabras_por_longitud_para_ui.setdefault(longitud, []).append(palabra_str)
-        self.game_ui.display_word_list(palabras_por_longitud_para_ui, self.pal_encontradas)
+        self._display_target_words()
         
         self.game_ui.update_status_labels(len(self.pal_encontradas), len(self.palabras_objetivo), self.score)
         self.game_ui.update_timer_label(self._format_time(self.time_elapsed))
@@ -274,9 +287,26 @@ class LexigramaGame:
             self.root.after_cancel(self._timer_after_id)
         self._timer_after_id = self.root.after(1000, self._update_timer) 
 
+    # --- Tamaño de Tablero ---
+    def _update_grid_preset_button(self):
+        rows, cols = self.game_settings.GRID_SIZE
+        self.menu_ui.update_grid_preset_text(f"Tablero: {rows}x{cols}")
+
+    def _cycle_grid_preset(self):
+        """Pasa al siguiente tamaño de GRID_PRESETS; la reserva de tableros se rellena para el nuevo tamaño."""
+        if self._generation_thread is not None and self._generation_thread.is_alive():
+            return # No cambiar la configuración mientras se genera un tablero
+        presets = list(self.game_settings.GRID_PRESETS)
+        current = presets.index(self.game_settings.GRID_PRESET) if self.game_settings.GRID_PRESET in presets else -1
+        self.game_settings.apply_grid_preset(presets[(current + 1) % len(presets)])
+        self._update_grid_preset_button()
+        self.board_pool.fill_in_background()
+
     # --- Lógica del Juego ---
     def _start_new_game_action(self):
-        """Prepara e inicia un nuevo juego."""
+        """Prepara un nuevo juego y lanza la generación del tablero sin bloquear la ventana."""
+        if self._generation_thread is not None and self._generation_thread.is_alive():
+            return # Ya hay una generación en curso: no lanzar otra
         if not self.username:
             self._show_message("Error: Usuario no definido para iniciar nueva partida.", 3000)
             self.menu_ui.enable_start_button()
@@ -299,13 +329,67 @@ class LexigramaGame:
 
         # --- Preparar Nuevo Juego ---
         self.menu_ui.disable_start_button()
-        self._show_message("Cargando palabras y generando tablero...", 0) 
-        self.root.update() 
+        self.menu_ui.show_status("Cargando palabras y generando tablero...")
 
         self.word_generator.game_settings.WORD_FILE = str(self.game_settings.WORD_FILE)
-        self.current_board = self.word_generator.generate_game_board()
-        self.palabras_objetivo = self.word_generator.get_target_words()
+        ready = self.board_pool.take()
+        if ready is not None:
+            # Tablero de la reserva: la partida empieza sin esperar a la generación
+            self.menu_ui.clear_status()
+            self.current_board, self.palabras_objetivo = ready
+            self._start_generated_game()
+            return
+
+        results: queue.Queue = queue.Queue()
+        self._generation_thread = threading.Thread(target=self._generate_board_worker, args=(results,),
+                                                   name="lexigrama-generacion", daemon=True)
+        self._generation_thread.start()
+        self.root.after(self.ui_settings.GENERATION_POLL_MS, self._poll_board_generation, results, time.monotonic())
 
+    def _generate_board_worker(self, results: queue.Queue):
+        """Corre en el hilo de generación: no toca Tk, solo deja el progreso y el resultado en la cola."""
+        try:
+            if self.game_settings.PARALLEL_GENERATION:
+                board = self.word_generator.generate_game_board_parallel()
+            else:
+                board = self.word_generator.generate_game_board(
+                    progress=lambda attempt, total: results.put(("progreso", attempt, total)))
+            results.put(("listo", board, list(self.word_generator.get_target_words())))
+        except Exception as e:
+            results.put(("error", e))
+
+    def _poll_board_generation(self, results: queue.Queue, started: float):
+        """Revisa la cola de la generación desde el loop de Tk y arranca el juego cuando termina."""
+        progress = None
+        outcome = None
+        while outcome is None:
+            try:
+                item = results.get_nowait()
+            except queue.Empty:
+                break
+            if item[0] == "progreso":
+                progress = item[1:]
+            else:
+                outcome = item
+
+        if outcome is None:
+            status = f"Generando tablero... {time.monotonic() - started:.1f} s"
+            if progress is not None:
+                status += f" (intento {progress[0]}/{progress[1]})"
+            self.menu_ui.show_status(status)
+            self.root.after(self.ui_settings.GENERATION_POLL_MS, self._poll_board_generation, results, started)
+            return
+
+        self.menu_ui.clear_status()
+        if outcome[0] == "error":
+            print(f"Error al generar el tablero: {outcome[1]}")
+            self.current_board, self.palabras_objetivo = None, []
+        else:
+            self.current_board, self.palabras_objetivo = outcome[1], outcome[2]
+        self._start_generated_game()
+
+    def _start_generated_game(self):
+        """Valida el tablero recién generado e inicia la partida."""
         # --- Validar Tablero y Palabras ---
         if self.current_board is None or not self.palabras_objetivo or \
            len(self.palabras_objetivo) != self.game_settings.TARGET_WORDS_COUNT:
@@ -313,7 +397,9 @@ class LexigramaGame:
             if not self.word_generator.palabras_completo_by_length: 
                 msg = f"Error: No se pudo cargar el archivo de palabras '{self.game_settings.WORD_FILE}'."
             self._show_message(msg, 7000) 
+            self.menu_ui.show_status(msg)
             self.menu_ui.enable_start_button()
+            self.board_pool.fill_in_background()
             return
 
         # --- Iniciar el Juego ---
@@ -321,11 +407,7 @@ class LexigramaGame:
         self.game_ui.display_board(self.current_board, self.current_selection_path)
         
         # --- Mostrar Palabras Objetivo ---
-        palabras_por_longitud_para_ui = {}
-        for palabra_str in self.palabras_objetivo:
-            longitud = len(palabra_str)
-            palabras_por_longitud_para_ui.setdefault(longitud, []).append(palabra_str)
-        self.game_ui.display_word_list(palabras_por_longitud_para_ui, self.pal_encontradas)
+        self._display_target_words()
         
         # --- Actualizar Interfaz ---
         self._show_game_interface() 
@@ -333,9 +415,17 @@ class LexigramaGame:
         self._show_message("¡Juego Iniciado! Encuentra las palabras.", 3000)
         #print(f"Juego iniciado con {len(self.palabras_objetivo)} palabras en el tablero.")
 
+    def _display_target_words(self):
+        """Muestra las palabras objetivo agrupadas por longitud (mismo camino para partida nueva y cargada)."""
+        palabras_por_longitud_para_ui = {}
+        for palabra_str in self.palabras_objetivo:
+            palabras_por_longitud_para_ui.setdefault(len(palabra_str), []).append(palabra_str)
+        self.game_ui.display_word_list(palabras_por_longitud_para_ui, self.pal_encontradas)
+
     # --- Reiniciar Estado del Juego ---
     def _reset_game_state(self):
         """Reinicia todas las variables de estado del juego para una nueva partida."""
+        self.board_pool.pause() # La reserva se rellena de vuelta en el menú, no durante la partida
         self.pal_encontradas.clear()
         self.score = 0
         self.time_elapsed = 0 
@@ -373,9 +463,10 @@ class LexigramaGame:
                 is_valid_next_step = True
             else:
                 last_r, last_c = self.current_selection_path[-1]
+                # Tamaño del tablero actual (una partida cargada puede ser de otro preset)
                 adjacents = self.word_generator._get_adjacent_cells(last_r, last_c, 
-                                                                    self.game_settings.GRID_SIZE[0], 
-                                                                    self.game_settings.GRID_SIZE[1])
+                                                                    len(self.current_board), 
+                                                                    len(self.current_board[0]))
                 # Verificar si la celda actual es adyacente a la última seleccionada
                 # y si la letra coincide con la celda seleccionada
                 if pos in adjacents:
@@ -414,12 +505,23 @@ class LexigramaGame:
         elif word_input in self.pal_encontradas:
             self._show_message(f"'{word_input}' ya fue encontrada.", 2000)
             self.sound_manager.play_incorrect_sound()
+        elif word_input in self._get_board_words():
+            self._show_message(f"'{word_input}' es una palabra válida, pero no es una palabra objetivo.", 2000)
+            self.sound_manager.play_incorrect_sound()
         else:
             self._show_message(f"'{word_input}' no es una palabra objetivo.", 2000)
             self.sound_manager.play_incorrect_sound()
         
         self._reset_grid_selection() 
 
+    def _get_board_words(self) -> Set[str]:
+        """Palabras del diccionario que se pueden formar en el tablero actual (se resuelve una vez por tablero)."""
+        board, words = self._board_words
+        if board is not self.current_board:
+            words = set(self.board_solver.solve(self.current_board)) if self.current_board else set()
+            self._board_words = (self.current_board, words)
+        return words
+
     # --- Actualización del Estado del Juego ---
     def _word_found(self, word: str):
         """Actualiza el estado del juego cuando se encuentra una palabra."""
@@ -670,9 +772,7 @@ Puntuación:
         def create_image_button(parent, image_path, text, command, width=180, height=45, hover_image_path=None):
             canvas = tk.Canvas(parent, width=width, height=height, highlightthickness=0, bg=self.ui_settings.COLORS['bg'])
             try:
-                img = Image.open(image_path)
-                img = img.resize((width, height), Image.Resampling.LANCZOS)
-                tk_img = ImageTk.PhotoImage(img)
+                tk_img = foto_tk(image_path, (width, height), master=canvas)
                 canvas.normal_img = tk_img
                 canvas.create_image(0, 0, anchor='nw', image=tk_img)
             except Exception as e:
@@ -680,9 +780,7 @@ Puntuación:
 
             if hover_image_path:
                 try:
-                    hover_img = Image.open(hover_image_path)
-                    hover_img = hover_img.resize((width, height), Image.Resampling.LANCZOS)
-                    tk_hover_img = ImageTk.PhotoImage(hover_img)
+                    tk_hover_img = foto_tk(hover_image_path, (width, height), master=canvas)
                     canvas.hover_img = tk_hover_img
                 except Exception as e:
                     print(f"Error al cargar imagen hover para botón: {e}")
@@ -741,6 +839,7 @@ Puntuación:
         except KeyboardInterrupt:
             print("\nJuego cerrado por el usuario.")
         finally:
+            cerrar_pool_generacion()
             if pygame.get_init(): 
                 pygame.quit() 
             print("Aplicación Lexigrama finalizada.")
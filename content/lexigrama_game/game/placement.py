@@ -0,0 +1,155 @@
+# game/placement.py
+import itertools
+import random
+from typing import List, Tuple, Set, Optional, Dict, Callable, Iterator
+
+from .grid import tabla_vecinos
+
+# Fuente de palabras para una ranura: (longitud, palabras a excluir, palabra original) -> iterador perezoso
+WordSource = Callable[[int, Set[str], str], Iterator[str]]
+
+# Todas las permutaciones de los vecinos de cada celda, por tamaño de tablero (a lo sumo 24 por celda):
+# elegir una al azar es mucho más barato que mezclar los vecinos en cada paso del DFS
+_PERMUTACIONES_POR_TAMANO: Dict[Tuple[int, int], Tuple[Tuple[Tuple[int, ...], ...], ...]] = {}
+
+
+def _tabla_permutaciones(rows: int, cols: int):
+    tabla = _PERMUTACIONES_POR_TAMANO.get((rows, cols))
+    if tabla is None:
+        vecinos, _ = tabla_vecinos(rows, cols)
+        tabla = _PERMUTACIONES_POR_TAMANO[(rows, cols)] = tuple(tuple(itertools.permutations(v)) for v in vecinos)
+    return tabla
+
+
+class BacktrackingPlacer:
+    """
+    Coloca las palabras objetivo en el tablero con búsqueda con retroceso sobre ranuras.
+    Cada ranura es una longitud de palabra; sus valores posibles son pares (palabra, camino):
+    primero la palabra elegida para la ranura y después reemplazos de la misma longitud.
+    En cada nodo se expande la ranura con menos valores (la más restringida), probando primero
+    los caminos que más letras reutilizan del tablero; si una ranura se queda sin valores,
+    se deshace la palabra anterior y se prueba su siguiente valor, en vez de tirar el tablero.
+    """
+    def __init__(self, rng: random.Random, max_nodes: int = 100, max_steps: int = 20000,
+                 words_per_slot: int = 150, values_per_slot: int = 3, paths_per_word: int = 2):
+        self._rng = rng
+        self.max_nodes = max_nodes
+        # Pasos de DFS (celdas visitadas buscando caminos) por llamada a place(): acota el tiempo total
+        self.max_steps = max_steps
+        self.words_per_slot = words_per_slot
+        self.values_per_slot = values_per_slot
+        self.paths_per_word = paths_per_word
+        # Nodos expandidos (palabras escritas en el tablero), pasos de DFS y palabras sin camino
+        # en la última llamada a place()
+        self.nodes_expanded = 0
+        self.steps = 0
+        self.paths_rejected = 0
+
+    def _best_path(self, letters: List[str], word: str, permutaciones) -> Optional[List[int]]:
+        """Entre los primeros `paths_per_word` caminos encontrados, el que más letras reutiliza."""
+        azar = self._rng.random
+        starts = [i for i, l in enumerate(letters) if l == ' ' or l == word[0]]
+        self._rng.shuffle(starts)
+        best, best_overlap, found = None, -1, 0
+        for start in starts:
+            camino = [start]
+            usados = 1 << start
+            perms = permutaciones[start]
+            pendientes = [iter(perms[int(azar() * len(perms))])]
+            while pendientes and len(camino) < len(word) and self.steps < self.max_steps:
+                siguiente = next(pendientes[-1], None)
+                if siguiente is None:
+                    pendientes.pop()
+                    usados &= ~(1 << camino.pop())
+                    continue
+                if usados >> siguiente & 1:
+                    continue
+                letra = letters[siguiente]
+                if letra != ' ' and letra != word[len(camino)]:
+                    continue
+                self.steps += 1
+                camino.append(siguiente)
+                usados |= 1 << siguiente
+                perms = permutaciones[siguiente]
+                pendientes.append(iter(perms[int(azar() * len(perms))]))
+            if len(camino) == len(word):
+                overlap = sum(letters[i] != ' ' for i in camino)
+                if overlap > best_overlap:
+                    best, best_overlap = camino, overlap
+                found += 1
+            if found >= self.paths_per_word or self.steps >= self.max_steps:
+                break
+        return best
+
+    def _slot_values(self, letters: List[str], slot: str, in_use: Set[str], permutaciones,
+                     word_source: WordSource) -> List[Tuple[str, List[int]]]:
+        """Valores (palabra, camino) de una ranura, ordenados por letras reutilizadas (más primero)."""
+        values = []
+        candidates = word_source(len(slot), in_use, slot)
+        if slot not in in_use:
+            candidates = _chain_first(slot, candidates)
+        for tried, word in enumerate(candidates):
+            if tried >= self.words_per_slot or len(values) >= self.values_per_slot or self.steps >= self.max_steps:
+                break
+            path = self._best_path(letters, word, permutaciones)
+            if path is not None:
+                values.append((word, path))
+            else:
+                self.paths_rejected += 1
+        values.sort(key=lambda v: sum(letters[i] != ' ' for i in v[1]), reverse=True)
+        return values
+
+    def _search(self, letters: List[str], pending: List[str], placed: List[str], in_use: Set[str],
+                permutaciones, word_source: WordSource) -> bool:
+        if not pending:
+            return True
+        best_idx, best_values = -1, None
+        for idx, slot in enumerate(pending):
+            values = self._slot_values(letters, slot, in_use, permutaciones, word_source)
+            if not values:
+                return False # Ranura sin valores: retroceder
+            if best_values is None or len(values) < len(best_values):
+                best_idx, best_values = idx, values
+        rest = pending[:best_idx] + pending[best_idx + 1:]
+        for word, path in best_values:
+            if self.nodes_expanded >= self.max_nodes or self.steps >= self.max_steps:
+                return False
+            self.nodes_expanded += 1
+            written = [i for i in path if letters[i] == ' ']
+            for i, letter in zip(path, word):
+                letters[i] = letter
+            placed.append(word)
+            in_use.add(word)
+            if self._search(letters, rest, placed, in_use, permutaciones, word_source):
+                return True
+            in_use.discard(word)
+            placed.pop()
+            for i in written:
+                letters[i] = ' '
+        return False
+
+    def place(self, board: List[List[str]], words: List[str], word_source: WordSource) -> Optional[List[str]]:
+        """
+        Coloca una palabra por ranura (una ranura por cada palabra de `words`) en el tablero,
+        que se modifica solo si hay solución. Devuelve las palabras colocadas o None.
+        """
+        rows, cols = len(board), len(board[0])
+        _, coords = tabla_vecinos(rows, cols)
+        permutaciones = _tabla_permutaciones(rows, cols)
+        letters = [board[r][c] for r, c in coords]
+        self.nodes_expanded = 0
+        self.steps = 0
+        self.paths_rejected = 0
+        placed: List[str] = []
+        # Con el tablero vacío todas las ranuras empatan: desempata la más larga
+        slots = sorted(dict.fromkeys(words), key=len, reverse=True)
+        if not self._search(letters, slots, placed, set(), permutaciones, word_source):
+            return None
+        for (r, c), letter in zip(coords, letters):
+            board[r][c] = letter
+        return placed
+
+
+def _chain_first(first: str, rest: Iterator[str]) -> Iterator[str]:
+    yield first
+    yield from rest
@@ -1,6 +1,108 @@
 # game/word_generator.py
+import atexit
+import multiprocessing
+import os
+import threading
 import random
-from typing import List, Tuple, Set, Optional, Dict
+import time
+from typing import List, Tuple, Set, Optional, Dict, Iterator, Callable
+from utils.lexicon import cargar_lexicon
+from .generation_stats import GenerationStats
+from .grid import tabla_vecinos
+from .placement import BacktrackingPlacer
+from .board_solver import BoardSolver
+
+# Palabras por longitud de cada archivo, cargadas una vez por proceso: {ruta: (léxico, {longitud: [palabras]})}
+_PALABRAS_POR_ARCHIVO: Dict[str, Tuple[object, Dict[int, List[str]]]] = {}
+
+
+class _IndiceTablero:
+    """
+    Celdas vacías y celdas por letra de un tablero en construcción (índices fila * columnas + columna),
+    para elegir las celdas iniciales sin recorrer el tablero entero en cada colocación.
+    """
+    __slots__ = ("board", "vacias", "por_letra")
+
+    def __init__(self, board: List[List[str]]):
+        self.board = board
+        cols = len(board[0])
+        self.vacias: Set[int] = set()
+        self.por_letra: Dict[str, Set[int]] = {}
+        for r, fila in enumerate(board):
+            for c, letra in enumerate(fila):
+                if letra == ' ':
+                    self.vacias.add(r * cols + c)
+                else:
+                    self.por_letra.setdefault(letra, set()).add(r * cols + c)
+
+    def inicios(self, letra: str) -> List[int]:
+        return [*self.vacias, *self.por_letra.get(letra, ())]
+
+    def escribir(self, celda: int, letra: str):
+        if celda in self.vacias:
+            self.vacias.discard(celda)
+            self.por_letra.setdefault(letra, set()).add(celda)
+
+
+# Pool de procesos de la generación en paralelo: se crea una vez por proceso y se reutiliza entre partidas.
+# Usa "spawn": el juego lo arranca desde un hilo dentro de Tk y hacer fork de un proceso con hilos no es seguro.
+_POOL_GENERACION = None
+_POOL_WORKERS = 0
+_POOL_CANCELAR = None  # Evento compartido: al activarse, los procesos abandonan su búsqueda
+_POOL_LOCK = threading.Lock()
+
+# En los procesos del pool: el evento de cancelación recibido al arrancar
+_cancelar_worker = None
+
+
+class _GeneracionCancelada(Exception):
+    """Otro proceso del pool ya encontró un tablero válido."""
+
+
+def _iniciar_worker(cancelar):
+    global _cancelar_worker
+    _cancelar_worker = cancelar
+
+
+def _revisar_cancelacion(intento, total):
+    if _cancelar_worker is not None and _cancelar_worker.is_set():
+        raise _GeneracionCancelada()
+
+
+def _generar_en_worker(args):
+    """Tarea de un proceso del pool: genera un tablero con su propia semilla y pocos intentos globales."""
+    game_settings, seed, max_attempts = args
+    generator = WordGenerator(game_settings)
+    try:
+        board = generator.generate_game_board(seed, max_attempts, progress=_revisar_cancelacion)
+    except _GeneracionCancelada:
+        board = None
+    return board, generator.get_target_words(), generator.get_generation_stats().to_dict()
+
+
+def _obtener_pool(workers: int):
+    """Devuelve el pool de generación del proceso (lo crea o lo recrea si cambió la cantidad de procesos)."""
+    global _POOL_GENERACION, _POOL_WORKERS, _POOL_CANCELAR
+    if _POOL_GENERACION is None or _POOL_WORKERS != workers:
+        cerrar_pool_generacion()
+        ctx = multiprocessing.get_context("spawn")
+        _POOL_CANCELAR = ctx.Event()
+        _POOL_GENERACION = ctx.Pool(workers, initializer=_iniciar_worker, initargs=(_POOL_CANCELAR,))
+        _POOL_WORKERS = workers
+    return _POOL_GENERACION, _POOL_CANCELAR
+
+
+def cerrar_pool_generacion():
+    """Cierra el pool de generación en paralelo, si se llegó a crear (al salir del juego)."""
+    global _POOL_GENERACION, _POOL_WORKERS, _POOL_CANCELAR
+    if _POOL_GENERACION is not None:
+        _POOL_GENERACION.terminate()
+        _POOL_GENERACION.join()
+    _POOL_GENERACION, _POOL_WORKERS, _POOL_CANCELAR = None, 0, None
+
+
+atexit.register(cerrar_pool_generacion)
+
 
 class WordGenerator:
     """
@@ -16,62 +118,77 @@ class WordGenerator:
         self.selected_target_words: List[str] = []
         # Tablero generado, inicialmente None hasta que se genere uno exitosamente.
         self.generated_board: Optional[List[List[str]]] = None
+        # Generador aleatorio propio: con una semilla fija, el tablero es reproducible.
+        self._rng = random.Random()
+        # Contadores y tiempos de la última generación
+        self.generation_stats = GenerationStats()
+        # Índice de celdas del tablero que se está construyendo
+        self._indice: Optional[_IndiceTablero] = None
+        # Solver del tablero, solo se crea si hay límite de palabras accidentales
+        self._solver = None
 
     def _cargar_pals_from_file(self, filename: str) -> bool:
-        """Carga palabras desde un archivo y las clasifica por longitud."""
+        """
+        Carga palabras desde un archivo y las clasifica por longitud.
+        Se hace una sola vez por proceso: los grupos por longitud quedan cacheados y solo
+        se reconstruyen si cambia el archivo (el léxico compilado controla su mtime).
+        """
         try:
-            # Abre el archivo y lee las palabras, eliminando espacios y convirtiéndolas a mayúsculas
-            with open(filename, "r", encoding="utf-8") as file:
-                palabras_completo_list = [line.strip().upper() for line in file if line.strip() and len(line.strip()) > 1]
-            self.palabras_completo_by_length.clear()
-
-            # Clasifica las palabras por longitud
-            for word in palabras_completo_list:
-                length = len(word)
-                self.palabras_completo_by_length.setdefault(length, []).append(word)
-            for length in self.palabras_completo_by_length:
-                random.shuffle(self.palabras_completo_by_length[length])
-            return True
+            lexicon = cargar_lexicon(filename)
         except FileNotFoundError:
             print(f"Error Crítico: No se encontró el archivo de palabras '{filename}'.")
             return False
+        cache = _PALABRAS_POR_ARCHIVO.get(str(filename))
+        if cache is None or cache[0] is not lexicon:
+            # Léxico compilado compartido (ya normalizado); aquí solo se pasa a mayúsculas
+            by_length: Dict[int, List[str]] = {}
+            for word in dict.fromkeys(w.upper() for w in lexicon.palabras() if len(w) > 1):
+                by_length.setdefault(len(word), []).append(word)
+            cache = _PALABRAS_POR_ARCHIVO[str(filename)] = (lexicon, by_length)
+        # Compartido entre partidas y generadores: solo lectura
+        self.palabras_completo_by_length = cache[1]
+        return True
 
     def _select_candidate_words(self) -> List[str]:
         """
         Selecciona las palabras objetivo basándose en la distribución deseada.
         Intenta cumplir la distribución y si no, completa con palabras aleatorias.
+        Las palabras se sortean directamente sobre los grupos cacheados, sin copiarlos ni mezclarlos.
         """
-        selected_words_set = set()
-        temp_words_by_length = {k: list(v) for k, v in self.palabras_completo_by_length.items()}
+        # dict como conjunto ordenado: el orden de un set depende del hash del proceso y rompería la semilla
+        selected_words_set: Dict[str, None] = {}
 
         for length, desired_count in self.game_settings.WORD_DISTRIBUTION.items():
-            available_for_length = temp_words_by_length.get(length, [])
-            random.shuffle(available_for_length)
-            count_added = 0
-            for word in available_for_length:
-                if count_added < desired_count and word not in selected_words_set:
-                    selected_words_set.add(word)
-                    count_added += 1
-            if count_added < desired_count:
-                print(f"Advertencia: No se pudieron seleccionar {desired_count} palabras de {length} letras. Se encontraron {count_added}.")
+            available_for_length = self.palabras_completo_by_length.get(length, [])
+            # Los grupos no tienen repetidas y cada longitud es distinta, así que no hay choques
+            sampled = self._rng.sample(available_for_length, min(desired_count, len(available_for_length)))
+            selected_words_set.update(dict.fromkeys(sampled))
+            if len(sampled) < desired_count:
+                print(f"Advertencia: No se pudieron seleccionar {desired_count} palabras de {length} letras. Se encontraron {len(sampled)}.")
 
         if len(selected_words_set) < self.game_settings.TARGET_WORDS_COUNT:
             needed_more = self.game_settings.TARGET_WORDS_COUNT - len(selected_words_set)
             all_remaining_flat = []
-            for l_val in sorted(temp_words_by_length.keys(), reverse=True):
-                for w_rem in temp_words_by_length.get(l_val, []):
+            for l_val in sorted(self.palabras_completo_by_length.keys(), reverse=True):
+                for w_rem in self.palabras_completo_by_length[l_val]:
                     if w_rem not in selected_words_set:
                         all_remaining_flat.append(w_rem)
-            random.shuffle(all_remaining_flat)
-            selected_words_set.update(all_remaining_flat[:needed_more])
+            selected_words_set.update(dict.fromkeys(self._rng.sample(all_remaining_flat, min(needed_more, len(all_remaining_flat)))))
         elif len(selected_words_set) > self.game_settings.TARGET_WORDS_COUNT:
-            return random.sample(list(selected_words_set), self.game_settings.TARGET_WORDS_COUNT)
+            return self._rng.sample(list(selected_words_set), self.game_settings.TARGET_WORDS_COUNT)
 
         return list(selected_words_set)
 
     def _create_empty_board(self, rows: int, cols: int) -> List[List[str]]:
-        """Crea un tablero vacío de un tamaño dado."""
-        return [[' ' for _ in range(cols)] for _ in range(rows)]
+        """Crea un tablero vacío de un tamaño dado (y su índice de celdas)."""
+        board = [[' ' for _ in range(cols)] for _ in range(rows)]
+        self._indice = _IndiceTablero(board)
+        return board
+
+    def _get_indice(self, board: List[List[str]]) -> _IndiceTablero:
+        if self._indice is None or self._indice.board is not board:
+            self._indice = _IndiceTablero(board)
+        return self._indice
 
     def _get_adjacent_cells(self, r: int, c: int, rows: int, cols: int) -> List[Tuple[int, int]]:
         """Devuelve las celdas adyacentes a una posición (r, c)."""
@@ -83,29 +200,50 @@ class WordGenerator:
                 adjacents.append((nr, nc))
         return adjacents
 
-    def _find_word_path(self, board: List[List[str]], word: str, row: int, col: int, visited: Set[Tuple[int, int]]) -> Optional[List[Tuple[int, int]]]:
+    def _find_word_path(self, board: List[List[str]], word: str, row: int, col: int, visited: Optional[Set[Tuple[int, int]]] = None) -> Optional[List[Tuple[int, int]]]:
         """
         Intenta encontrar un camino para colocar una palabra en el tablero
         a partir de una celda inicial, evitando ciclos y celdas ya visitadas.
+        DFS iterativo: las celdas visitadas se llevan en un bitboard (un bit por celda)
+        y los vecinos salen de la tabla precalculada para el tamaño del tablero.
         """
+        rows, cols = len(board), len(board[0])
+        vecinos, coords = tabla_vecinos(rows, cols)
+        inicio = row * cols + col
         if board[row][col] != ' ' and board[row][col] != word[0]:
             return None # La primera letra no coincide y la celda no está vacía
-
         if len(word) == 1:
             return [(row, col)] # Se encontró un camino para la última letra
 
-        visited_copy = visited.copy()
-        visited_copy.add((row, col))
-
-        rows, cols = len(board), len(board[0])
-        adjacents = self._get_adjacent_cells(row, col, rows, cols)
-        random.shuffle(adjacents) # Aleatorizar la búsqueda de caminos
-
-        for next_r, next_c in adjacents:
-            if (next_r, next_c) not in visited_copy:
-                path = self._find_word_path(board, word[1:], next_r, next_c, visited_copy)
-                if path:
-                    return [(row, col)] + path
+        usados = 1 << inicio
+        for r_v, c_v in visited or ():
+            usados |= 1 << (r_v * cols + c_v)
+        camino = [inicio]
+        pasos = 0 # Celdas visitadas, para las estadísticas
+        # Pila de vecinos pendientes por nivel, en orden aleatorio
+        pendientes = [self._rng.sample(vecinos[inicio], len(vecinos[inicio]))]
+        while pendientes:
+            opciones = pendientes[-1]
+            if not opciones:
+                # Sin salida desde esta celda: retroceder
+                pendientes.pop()
+                usados &= ~(1 << camino.pop())
+                continue
+            siguiente = opciones.pop()
+            if usados >> siguiente & 1:
+                continue
+            letra_tablero = board[coords[siguiente][0]][coords[siguiente][1]]
+            if letra_tablero != ' ' and letra_tablero != word[len(camino)]:
+                continue
+            camino.append(siguiente)
+            usados |= 1 << siguiente
+            pasos += 1
+            if len(camino) == len(word):
+                self.generation_stats.dfs_nodes += pasos
+                return [coords[celda] for celda in camino]
+            pendientes.append(self._rng.sample(vecinos[siguiente], len(vecinos[siguiente])))
+        self.generation_stats.dfs_nodes += pasos
+        self.generation_stats.paths_rejected += 1
         return None
 
     def _place_word_on_board(self, board: List[List[str]], word: str, max_attempts: int = 200) -> bool:
@@ -113,35 +251,25 @@ class WordGenerator:
         Intenta insertar una palabra en el tablero en un camino válido.
         Prioriza celdas vacías o que ya contengan la letra correcta.
         """
-        rows, cols = len(board), len(board[0])
+        cols = len(board[0])
         word_upper = word.upper()
+        indice = self._get_indice(board)
 
-        possible_starts = []
-        for r_idx in range(rows):
-            for c_idx in range(cols):
-                if board[r_idx][c_idx] == ' ' or board[r_idx][c_idx] == word_upper[0]:
-                    possible_starts.append((r_idx, c_idx))
-        random.shuffle(possible_starts)
+        # Celdas iniciales desde el índice: vacías o con la primera letra, sin recorrer el tablero
+        possible_starts = indice.inicios(word_upper[0])
+        self._rng.shuffle(possible_starts)
 
-        attempts_made = 0
-        for start_row, start_col in possible_starts:
-            attempts_made += 1
+        for attempts_made, start in enumerate(possible_starts, 1):
             if attempts_made > max_attempts:
                 break # Demasiados intentos para esta palabra
 
-            path = self._find_word_path(board, word_upper, start_row, start_col, set())
+            # El DFS solo pisa celdas vacías o con la misma letra, así que el camino se puede escribir tal cual
+            path = self._find_word_path(board, word_upper, start // cols, start % cols)
             if path:
-                # Verificar si el camino es válido para escribir (no sobreescribir letras diferentes)
-                is_valid_to_write = True
                 for (path_r, path_c), char_in_word in zip(path, word_upper):
-                    if board[path_r][path_c] != ' ' and board[path_r][path_c] != char_in_word:
-                        is_valid_to_write = False
-                        break
-                if is_valid_to_write:
-                    # Escribir la palabra en el tablero
-                    for (path_r, path_c), char_in_word in zip(path, word_upper):
-                        board[path_r][path_c] = char_in_word
-                    return True
+                    board[path_r][path_c] = char_in_word
+                    indice.escribir(path_r * cols + path_c, char_in_word)
+                return True
         return False
 
     def _fill_empty_cells(self, board: List[List[str]]):
@@ -152,74 +280,163 @@ class WordGenerator:
             all_letras_in_target_words.update(word.upper())
 
         # Pool de letras para relleno, priorizando las del vocabulario del juego
-        fill_letter_pool = list(all_letras_in_target_words) * 2 + list('AEIOU') * 2 + list(common_letras)
-        random.shuffle(fill_letter_pool)
-
-        for r_idx in range(len(board)):
-            for c_idx in range(len(board[0])):
-                if board[r_idx][c_idx] == ' ':
-                    if fill_letter_pool:
-                        board[r_idx][c_idx] = random.choice(fill_letter_pool)
-                    else: # Si se acaban las letras del pool, usar las comunes
-                        board[r_idx][c_idx] = random.choice(common_letras)
+        fill_letter_pool = sorted(all_letras_in_target_words) * 2 + list('AEIOU') * 2 + list(common_letras)
+        self._rng.shuffle(fill_letter_pool)
+
+        cols = len(board[0])
+        for celda in sorted(self._get_indice(board).vacias):
+            r_idx, c_idx = divmod(celda, cols)
+            if fill_letter_pool:
+                board[r_idx][c_idx] = self._rng.choice(fill_letter_pool)
+            else: # Si se acaban las letras del pool, usar las comunes
+                board[r_idx][c_idx] = self._rng.choice(common_letras)
+        self._indice = None
+
+    def _iter_replacements(self, length: int, excluded: Set[str], original: str) -> Iterator[str]:
+        """
+        Recorre en orden aleatorio las palabras de una longitud, saltando `original` y las de `excluded`.
+        Es un Fisher-Yates perezoso sobre el grupo cacheado (que no se copia ni se modifica): cada paso
+        cuesta O(1) y solo se guardan las posiciones intercambiadas. Nunca repite una palabra.
+        """
+        bucket = self.palabras_completo_by_length.get(length, [])
+        n = len(bucket)
+        swaps: Dict[int, int] = {}
+        for i in range(n):
+            j = self._rng.randrange(i, n)
+            chosen = swaps.get(j, j)
+            swaps[j] = swaps.get(i, i)
+            word = bucket[chosen]
+            if word != original and word not in excluded:
+                yield word
+
+    def _place_words_greedy(self, board: List[List[str]], words: List[str]) -> Optional[List[str]]:
+        """
+        Colocación voraz: de la más larga a la más corta, cada palabra (o un reemplazo de su misma
+        longitud) se fija en el primer camino que entre. Devuelve las palabras colocadas o None.
+        """
+        words_successfully_placed = []
+        placed_set: Set[str] = set()
+        stats = self.generation_stats
+        stats.replacements_per_slot = []
+
+        # Ordenar palabras por longitud descendente para intentar colocar las más largas primero
+        words_to_place_ordered = sorted(dict.fromkeys(words), key=len, reverse=True)
+
+        for original_word_for_slot in words_to_place_ordered:
+            word_placed_for_slot = False
+            # Reemplazos perezosos: cada uno sale del iterador en O(1), sin recorrer el grupo entero
+            replacements = None
+            replacements_tried = 0 # Solo los reemplazos que el iterador llegó a entregar
+
+            for replacement_attempt in range(self.game_settings.MAX_REPLACEMENTS_PER_SLOT + 1):
+                word_to_attempt_placement = original_word_for_slot
+                if replacement_attempt > 0: # Para intentos de reemplazo, buscar otra palabra
+                    if replacements is None:
+                        replacements = self._iter_replacements(
+                            len(original_word_for_slot), placed_set, original_word_for_slot)
+                    word_to_attempt_placement = next(replacements, None)
+                    if word_to_attempt_placement is None:
+                        break
+                    replacements_tried += 1
+
+                stats.placement_nodes += 1
+                if self._place_word_on_board(board, word_to_attempt_placement):
+                    words_successfully_placed.append(word_to_attempt_placement)
+                    placed_set.add(word_to_attempt_placement)
+                    word_placed_for_slot = True
+                    break # Palabra colocada, pasar a la siguiente ranura
+
+            stats.replacements_per_slot.append(replacements_tried)
+            stats.replacements_total += replacements_tried
+            if not word_placed_for_slot:
+                return None # No se pudo colocar esta palabra ni sus reemplazos, falló el intento
+        return words_successfully_placed
+
+    def _place_words_backtracking(self, board: List[List[str]], words: List[str]) -> Optional[List[str]]:
+        """
+        Colocación con retroceso (BacktrackingPlacer): cada palabra es una ranura de su longitud que
+        también acepta reemplazos, y una ranura sin salida deshace la anterior en vez de tirar el tablero.
+        """
+        placer = BacktrackingPlacer(self._rng, self.game_settings.MAX_PLACEMENT_NODES, self.game_settings.MAX_PLACEMENT_STEPS)
+        placed = placer.place(board, words, self._iter_replacements)
+        self.generation_stats.placement_nodes += placer.nodes_expanded
+        self.generation_stats.dfs_nodes += placer.steps
+        self.generation_stats.paths_rejected += placer.paths_rejected
+        self._indice = None # El motor escribe el tablero directamente: el índice se reconstruye al usarlo
+        return placed
+
+    def _too_many_accidental_words(self, board: List[List[str]]) -> bool:
+        """Indica si el tablero supera MAX_ACCIDENTAL_WORDS (palabras formables que no son objetivo)."""
+        limit = self.game_settings.MAX_ACCIDENTAL_WORDS
+        if limit is None:
+            return False
+        if self._solver is None:
+            self._solver = BoardSolver(self.game_settings)
+        return len(self._solver.accidental_words(board, self.selected_target_words)) > limit
 
-    def generate_game_board(self) -> Optional[List[List[str]]]:
+    def generate_game_board(self, seed: Optional[int] = None, max_attempts: Optional[int] = None,
+                            progress: Optional[Callable[[int, int], None]] = None) -> Optional[List[List[str]]]:
         """
         Intenta generar un tablero de sopa de letras con las palabras objetivo.
-        Retorna el tablero generado o None si falla tras múltiples intentos.
+        Con la misma `seed` (y la misma configuración y archivo de palabras) el tablero es siempre el mismo.
+        `max_attempts` reemplaza a MAX_GLOBAL_GENERATION_ATTEMPTS (lo usa la generación en paralelo).
+        `progress(intento, total)` se llama al empezar cada intento global.
+        Retorna el tablero generado o None si falla tras múltiples intentos; los contadores y tiempos
+        quedan en get_generation_stats() (y en GENERATION_STATS_LOG, si está configurado).
         """
-        if not self._cargar_pals_from_file(self.game_settings.WORD_FILE):
+        self._rng = random.Random(seed)
+        stats = self.generation_stats = GenerationStats(self.game_settings.PLACEMENT_ENGINE, self.game_settings.GRID_SIZE, seed)
+        inicio = time.perf_counter()
+        try:
+            return self._generate_game_board(max_attempts, progress, stats)
+        finally:
+            stats.total_time = time.perf_counter() - inicio
+            if self.game_settings.GENERATION_STATS_LOG:
+                stats.log_json_line(self.game_settings.GENERATION_STATS_LOG)
+
+    def _generate_game_board(self, max_attempts: Optional[int], progress: Optional[Callable[[int, int], None]],
+                             stats: GenerationStats) -> Optional[List[List[str]]]:
+        t = time.perf_counter()
+        loaded = self._cargar_pals_from_file(self.game_settings.WORD_FILE)
+        stats.lexicon_load_time = time.perf_counter() - t
+        if not loaded:
             return None
+        if max_attempts is None:
+            max_attempts = self.game_settings.MAX_GLOBAL_GENERATION_ATTEMPTS
 
-        for global_attempt_idx in range(self.game_settings.MAX_GLOBAL_GENERATION_ATTEMPTS):
+        for global_attempt_idx in range(max_attempts):
+            stats.global_attempts = global_attempt_idx + 1
+            if progress is not None:
+                progress(global_attempt_idx + 1, max_attempts)
             #print(f"Intento global de generación de tablero: {global_attempt_idx + 1}")
+            t = time.perf_counter()
             self.selected_target_words = self._select_candidate_words()
+            stats.selection_time += time.perf_counter() - t
             if not self.selected_target_words or len(self.selected_target_words) != self.game_settings.TARGET_WORDS_COUNT:
                 #print(f"No se pudieron seleccionar {self.game_settings.TARGET_WORDS_COUNT} palabras objetivo en este intento global.")
                 continue # Reintentar con otra selección de palabras
 
             rows, cols = self.game_settings.GRID_SIZE
+            t = time.perf_counter()
             current_board = self._create_empty_board(rows, cols)
-            words_successfully_placed = []
-            palabras_completo_placed_in_current_attempt = True
-
-            # Ordenar palabras por longitud descendente para intentar colocar las más largas primero
-            words_to_place_ordered = sorted(list(set(self.selected_target_words)), key=len, reverse=True)
-
-            for original_word_for_slot in words_to_place_ordered:
-                word_placed_for_slot = False
-                words_already_tried_for_this_slot = {original_word_for_slot}
-
-                for replacement_attempt in range(self.game_settings.MAX_REPLACEMENTS_PER_SLOT + 1):
-                    word_to_attempt_placement = original_word_for_slot
-                    if replacement_attempt > 0: # Para intentos de reemplazo, buscar otra palabra
-                        length_needed = len(original_word_for_slot)
-                        possible_replacements = [
-                            w for w in self.palabras_completo_by_length.get(length_needed, [])
-                            if w not in words_successfully_placed and
-                               w not in words_already_tried_for_this_slot
-                        ]
-                        random.shuffle(possible_replacements)
-                        if possible_replacements:
-                            word_to_attempt_placement = possible_replacements[0]
-                            words_already_tried_for_this_slot.add(word_to_attempt_placement)
-                        else:
-                            break
-
-                    if self._place_word_on_board(current_board, word_to_attempt_placement):
-                        words_successfully_placed.append(word_to_attempt_placement)
-                        word_placed_for_slot = True
-                        break # Palabra colocada, pasar a la siguiente ranura
-
-                if not word_placed_for_slot:
-                    palabras_completo_placed_in_current_attempt = False
-                    break # No se pudo colocar esta palabra ni sus reemplazos, falló el intento
+            if self.game_settings.PLACEMENT_ENGINE == "backtracking":
+                words_successfully_placed = self._place_words_backtracking(current_board, self.selected_target_words)
+            else:
+                words_successfully_placed = self._place_words_greedy(current_board, self.selected_target_words)
+            stats.placement_time += time.perf_counter() - t
+            palabras_completo_placed_in_current_attempt = words_successfully_placed is not None
 
             if palabras_completo_placed_in_current_attempt and \
                len(set(words_successfully_placed)) == len(set(self.selected_target_words)):
-                self.selected_target_words = list(set(words_successfully_placed)) # Actualizar con las que realmente se colocaron
+                self.selected_target_words = list(dict.fromkeys(words_successfully_placed)) # Actualizar con las que realmente se colocaron
+                t = time.perf_counter()
                 self._fill_empty_cells(current_board)
+                stats.fill_time += time.perf_counter() - t
+                if self._too_many_accidental_words(current_board):
+                    stats.boards_rejected_accidental += 1
+                    continue # El relleno formó demasiadas palabras no objetivo: otro intento global
                 self.generated_board = current_board
+                stats.success = True
                 #print(f"Tablero generado exitosamente en el intento global {global_attempt_idx + 1}.")
                 self._print_word_distribution(self.selected_target_words)
                 return self.generated_board
@@ -228,6 +445,62 @@ class WordGenerator:
         self.selected_target_words = [] # Limpiar palabras objetivo si no se pudo generar el tablero
         return None
 
+    def generate_game_board_parallel(self, workers: Optional[int] = None, seed: Optional[int] = None) -> Optional[List[List[str]]]:
+        """
+        Reparte los intentos globales entre varios procesos, cada uno con una semilla independiente.
+        Gana el primer tablero válido que llegue y el resto de los procesos abandona su búsqueda
+        al empezar su siguiente intento. El pool se reutiliza entre llamadas (ver cerrar_pool_generacion).
+        Con `seed` las semillas de los procesos son reproducibles, pero el ganador depende de cuál
+        termine antes: para un tablero reproducible usar generate_game_board(seed).
+        """
+        if workers is None:
+            workers = self.game_settings.GENERATION_WORKERS or os.cpu_count() or 1
+        if workers <= 1:
+            return self.generate_game_board(seed)
+        # Se carga también aquí: el juego consulta los grupos para distinguir un error de archivo
+        if not self._cargar_pals_from_file(self.game_settings.WORD_FILE):
+            return None
+
+        total_attempts = self.game_settings.MAX_GLOBAL_GENERATION_ATTEMPTS
+        attempts_per_worker = max(1, -(-total_attempts // workers))
+        seeds_rng = random.Random(seed)
+        tasks = [(self.game_settings, seeds_rng.getrandbits(64), attempts_per_worker) for _ in range(workers)]
+
+        self.selected_target_words = []
+        self.generated_board = None
+        # Si ningún proceso lo logra quedan los contadores sumados de todos, no los de la llamada anterior
+        self.generation_stats = GenerationStats(self.game_settings.PLACEMENT_ENGINE, self.game_settings.GRID_SIZE, seed)
+        inicio = time.perf_counter()
+        with _POOL_LOCK:
+            pool, cancelar = _obtener_pool(workers)
+            cancelar.clear()
+            # Se consumen todos los resultados (los perdedores terminan enseguida) para dejar el pool libre
+            for board, words, stats in pool.imap_unordered(_generar_en_worker, tasks):
+                if board is not None and self.generated_board is None:
+                    self.generated_board = board
+                    self.selected_target_words = words
+                    self.generation_stats = GenerationStats.from_dict(stats) # Las del proceso ganador
+                    cancelar.set()
+                elif self.generated_board is None:
+                    self.generation_stats.acumular(GenerationStats.from_dict(stats))
+        if self.generated_board is None:
+            self.generation_stats.total_time = time.perf_counter() - inicio
+        return self.generated_board
+
+    def generate_from_seed(self, seed: int) -> Tuple[Optional[List[List[str]]], List[str]]:
+        """Genera el tablero de una semilla y devuelve (tablero, palabras objetivo)."""
+        board = self.generate_game_board(seed)
+        return board, list(self.get_target_words())
+
+    def generate_with_stats(self, seed: Optional[int] = None) -> Tuple[Optional[List[List[str]]], GenerationStats]:
+        """Genera un tablero y lo devuelve junto con sus estadísticas de generación."""
+        board = self.generate_game_board(seed)
+        return board, self.generation_stats
+
+    def get_generation_stats(self) -> GenerationStats:
+        """Estadísticas (contadores y tiempos) de la última generación de tablero."""
+        return self.generation_stats
+
     def get_target_words(self) -> List[str]:
         """Devuelve la lista de palabras objetivo seleccionadas para el tablero actual."""
         return self.selected_target_words
@@ -0,0 +1,119 @@
+# ui/board_canvas.py
+import tkinter as tk
+from typing import List, Tuple, Optional, Set, Callable
+
+
+class CanvasBoard:
+    """
+    Tablero de letras dibujado en un único tk.Canvas: un rectángulo y un texto por celda.
+    Los clics se resuelven por coordenadas (no hay un widget por celda) y los cambios de color,
+    letra o estado se hacen con itemconfig sobre los ítems, así escala a tableros de 10x10 o más.
+    """
+    GAP = 2  # Separación en píxeles entre celdas, como el padx/pady de los botones
+
+    def __init__(self, parent: tk.Frame, ui_settings, on_cell_click: Callable[[int, int, str], None],
+                 width: int = 420, height: int = 420):
+        self.ui_settings = ui_settings
+        self.on_cell_click = on_cell_click
+        self.canvas = tk.Canvas(parent, width=width, height=height, bg=ui_settings.COLORS['bg'],
+                                highlightthickness=0, cursor="hand2")
+        self.canvas.grid(row=0, column=0, sticky="nsew")
+        parent.grid_rowconfigure(0, weight=1)
+        parent.grid_columnconfigure(0, weight=1)
+
+        self.rows = 0
+        self.cols = 0
+        self.enabled = True
+        # Ítems y letras por celda, indexados por fila * columnas + columna
+        self._rect_ids: List[int] = []
+        self._text_ids: List[int] = []
+        self._letters: List[str] = []
+        self._highlighted: Set[int] = set()
+        self._font: Optional[Tuple] = None
+        self._cell_w = 1.0
+        self._cell_h = 1.0
+
+        self.canvas.bind("<Button-1>", self._on_click)
+        self.canvas.bind("<Configure>", lambda e: self._layout(e.width, e.height))
+
+    # --- Dibujo ---
+    def display(self, board: List[List[str]], selected: Set[Tuple[int, int]], font: Tuple):
+        """Dibuja el tablero; si las dimensiones no cambiaron, solo actualiza las letras distintas."""
+        rows, cols = len(board), len(board[0])
+        letters = [letter for row in board for letter in row]
+        if (rows, cols) != (self.rows, self.cols):
+            self._create_cells(rows, cols, letters, font)
+        else:
+            for i, letter in enumerate(letters):
+                if self._letters[i] != letter:
+                    self.canvas.itemconfig(self._text_ids[i], text=letter)
+            if font != self._font:
+                self.canvas.itemconfig("letra", font=font)
+        self._letters = letters
+        self._font = font
+        self.update_selection(selected)
+
+    def _create_cells(self, rows: int, cols: int, letters: List[str], font: Tuple):
+        self.canvas.delete("all")
+        self.rows, self.cols = rows, cols
+        self._highlighted = set()
+        fg = self.ui_settings.COLORS['grid_fg'] if self.enabled else "#888888"
+        self._rect_ids = [
+            self.canvas.create_rectangle(0, 0, 0, 0, fill=self.ui_settings.COLORS['grid'],
+                                         outline=self.ui_settings.COLORS['bg'], tags="celda")
+            for _ in letters
+        ]
+        self._text_ids = [
+            self.canvas.create_text(0, 0, text=letter, font=font, fill=fg, tags="letra")
+            for letter in letters
+        ]
+        self._layout(self.canvas.winfo_width(), self.canvas.winfo_height())
+
+    def _layout(self, width: int, height: int):
+        """Reubica los ítems según el tamaño actual del canvas (solo al crear celdas o redimensionar)."""
+        if not self.rows or width <= 1 or height <= 1:
+            return # Todavía sin tamaño: el evento <Configure> volverá a llamar
+        self._cell_w = width / self.cols
+        self._cell_h = height / self.rows
+        half_gap = self.GAP / 2
+        for i, (rect_id, text_id) in enumerate(zip(self._rect_ids, self._text_ids)):
+            r, c = divmod(i, self.cols)
+            x0, y0 = c * self._cell_w, r * self._cell_h
+            self.canvas.coords(rect_id, x0 + half_gap, y0 + half_gap,
+                               x0 + self._cell_w - half_gap, y0 + self._cell_h - half_gap)
+            self.canvas.coords(text_id, x0 + self._cell_w / 2, y0 + self._cell_h / 2)
+
+    def update_selection(self, selected: Set[Tuple[int, int]]):
+        """Repinta solo las celdas que entraron o salieron de la selección."""
+        cells = {r * self.cols + c for r, c in selected if 0 <= r < self.rows and 0 <= c < self.cols}
+        for i in self._highlighted - cells:
+            self.canvas.itemconfig(self._rect_ids[i], fill=self.ui_settings.COLORS['grid'])
+        for i in cells - self._highlighted:
+            self.canvas.itemconfig(self._rect_ids[i], fill=self.ui_settings.COLORS['selected_cell_bg'])
+        self._highlighted = cells
+
+    def set_enabled(self, enabled: bool):
+        """Habilita o deshabilita los clics del tablero (una sola llamada para todas las letras)."""
+        if enabled == self.enabled:
+            return
+        self.enabled = enabled
+        self.canvas.itemconfig("letra", fill=self.ui_settings.COLORS['grid_fg'] if enabled else "#888888")
+        self.canvas.config(cursor="hand2" if enabled else "arrow")
+
+    # --- Eventos ---
+    def cell_at(self, x: float, y: float) -> Optional[Tuple[int, int]]:
+        """Celda (fila, columna) bajo las coordenadas del canvas, o None si cae fuera del tablero."""
+        if not self.rows or x < 0 or y < 0:
+            return None
+        r, c = int(y // self._cell_h), int(x // self._cell_w)
+        if r >= self.rows or c >= self.cols:
+            return None
+        return r, c
+
+    def _on_click(self, event):
+        if not self.enabled:
+            return
+        cell = self.cell_at(event.x, event.y)
+        if cell is not None:
+            r, c = cell
+            self.on_cell_click(r, c, self._letters[r * self.cols + c])
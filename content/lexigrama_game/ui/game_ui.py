@@ -2,8 +2,9 @@
 import tkinter as tk
 from tkinter import PhotoImage, Frame, Label, Button, Entry, SOLID, RAISED, DISABLED, NORMAL, END
 from typing import List, Tuple, Optional, Dict, Set
-from PIL import Image, ImageTk
 from ..config.settings import UI_SETTINGS
+from utils.image_cache import foto_tk
+from .board_canvas import CanvasBoard
 import os
 
 class GameUI:
@@ -22,11 +23,22 @@ class GameUI:
         self.on_back_to_menu_and_save_callback = on_back_to_menu_and_save
 
         self.grid_cell_widgets: List[List[Optional[tk.Button]]] = []
+        self._cell_letters: List[List[Optional[str]]] = []  # Letra que muestra cada celda reutilizada
+        self._grid_font: Optional[Tuple] = None
+        self._highlighted: Set[Tuple[int, int]] = set()  # Celdas pintadas como seleccionadas
         self.hint_labels: Dict[str, List[tk.Label]] = {}
+        self._word_list_key: Optional[Tuple] = None  # Palabras del panel de pistas construido
+        self._shown_found: Set[str] = set()  # Palabras que el panel muestra como encontradas
 
         self.frame_sopa = tk.Frame(root, bg=self.ui_settings.COLORS['bg'])
         self.frame_input = tk.Frame(root, bg=self.ui_settings.COLORS['bg'])
         self.frame_lista = tk.Frame(root, bg=self.ui_settings.COLORS['bg'])
+        self._create_word_list_panel()
+
+        # Tablero en un solo Canvas si así se configuró; si no, grid_cell_widgets guarda un botón por celda
+        self.board_canvas: Optional[CanvasBoard] = None
+        if self.ui_settings.BOARD_BACKEND == "canvas":
+            self.board_canvas = CanvasBoard(self.frame_sopa, self.ui_settings, self.on_cell_click_callback)
 
         # Atributo para almacenar el estado de la música
         self.music_on = False
@@ -168,6 +180,40 @@ class GameUI:
         # Estado inicial del icono de música
         self.update_music_button_text(self.music_on)
 
+    def _create_word_list_panel(self):
+        """Panel de pistas desplazable: con los tamaños grandes la lista de palabras no entra en la ventana."""
+        self._lista_canvas = tk.Canvas(self.frame_lista, bg=self.ui_settings.COLORS['bg'], highlightthickness=0, width=1)
+        self._lista_scroll = tk.Scrollbar(self.frame_lista, orient=tk.VERTICAL, command=self._lista_canvas.yview)
+        self._lista_canvas.configure(yscrollcommand=self._lista_scroll.set)
+        self._lista_scroll.pack(side=tk.RIGHT, fill=tk.Y)
+        self._lista_canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+
+        self.frame_lista_contenido = tk.Frame(self._lista_canvas, bg=self.ui_settings.COLORS['bg'])
+        self._lista_canvas.create_window(0, 0, window=self.frame_lista_contenido, anchor="nw")
+        self.frame_lista_contenido.bind("<Configure>", self._on_word_list_configure)
+
+        # La rueda del mouse desplaza la lista solo con el puntero encima
+        def bind_wheel(e):
+            self._lista_canvas.bind_all("<MouseWheel>", self._on_word_list_wheel)
+            self._lista_canvas.bind_all("<Button-4>", self._on_word_list_wheel)
+            self._lista_canvas.bind_all("<Button-5>", self._on_word_list_wheel)
+        def unbind_wheel(e):
+            for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+                self._lista_canvas.unbind_all(sequence)
+        self._lista_canvas.bind("<Enter>", bind_wheel)
+        self._lista_canvas.bind("<Leave>", unbind_wheel)
+
+    def _on_word_list_configure(self, event=None):
+        # El canvas toma el ancho del contenido y su área desplazable abarca toda la lista
+        self._lista_canvas.configure(scrollregion=self._lista_canvas.bbox("all"),
+                                     width=self.frame_lista_contenido.winfo_reqwidth())
+
+    def _on_word_list_wheel(self, event):
+        if getattr(event, 'num', None) == 4 or getattr(event, 'delta', 0) > 0:
+            self._lista_canvas.yview_scroll(-1, "units")
+        else:
+            self._lista_canvas.yview_scroll(1, "units")
+
     def _set_canvas_button_state(self, canvas, state="normal"):
         """Simula habilitar o deshabilitar un botón Canvas."""
         canvas.state = state
@@ -188,9 +234,7 @@ class GameUI:
         """Crea un botón personalizado usando Canvas con imagen y texto, con efecto hover."""
         canvas = tk.Canvas(parent, width=width, height=height, highlightthickness=0, bg=self.ui_settings.COLORS['bg'])
         try:
-            img = Image.open(image_path)
-            img = img.resize((width, height), Image.Resampling.LANCZOS)
-            tk_img = ImageTk.PhotoImage(img)
+            tk_img = foto_tk(image_path, (width, height), master=canvas)
             canvas.normal_img = tk_img  # Mantener referencia
             canvas.create_image(0, 0, anchor='nw', image=tk_img)
         except Exception as e:
@@ -199,9 +243,7 @@ class GameUI:
         # Imagen hover
         if hover_image_path:
             try:
-                hover_img = Image.open(hover_image_path)
-                hover_img = hover_img.resize((width, height), Image.Resampling.LANCZOS)
-                tk_hover_img = ImageTk.PhotoImage(hover_img)
+                tk_hover_img = foto_tk(hover_image_path, (width, height), master=canvas)
                 canvas.hover_img = tk_hover_img
             except Exception as e:
                 print(f"Error al cargar imagen hover para botón: {e}")
@@ -295,92 +337,165 @@ class GameUI:
         self.frame_lista.grid_remove()
 
     # --- Métodos de actualización visual del tablero y lista de palabras ---
-    def display_board(self, board: List[List[str]], current_selection_path: List[Tuple[int, int]]):
-        """Dibuja o actualiza el tablero de letras."""
-        for widget in self.frame_sopa.winfo_children():
-            widget.destroy()
-        self.grid_cell_widgets = [[None for _ in range(len(board[0]))] for _ in range(len(board))]
-        font_grid_tuple = (self.ui_settings.MAIN_FONT_FAMILY, self.ui_settings.GRID_LETTER_FONT_SIZE, "bold")
+    def _grid_font_size(self, rows: int, cols: int) -> int:
+        """Tamaño de letra de la grilla: el configurado hasta 6 celdas por lado, más chico en tableros grandes."""
+        size = self.ui_settings.GRID_LETTER_FONT_SIZE
+        return max(10, min(size, size * 6 // max(rows, cols, 1)))
 
+    def display_board(self, board: List[List[str]], current_selection_path: List[Tuple[int, int]]):
+        """
+        Dibuja o actualiza el tablero de letras. Las celdas se reutilizan entre partidas:
+        solo se crean o destruyen botones cuando cambian las dimensiones del tablero,
+        y solo se reconfiguran las celdas cuya letra o color cambió.
+        """
+        rows, cols = len(board), len(board[0])
+        if self.board_canvas is not None:
+            font_grid_tuple = (self.ui_settings.MAIN_FONT_FAMILY, self._grid_font_size(rows, cols), "bold")
+            self.board_canvas.display(board, {tuple(pos) for pos in current_selection_path}, font_grid_tuple)
+            return
+        old_rows = len(self.grid_cell_widgets)
+        old_cols = len(self.grid_cell_widgets[0]) if old_rows else 0
+        font_grid_tuple = (self.ui_settings.MAIN_FONT_FAMILY, self._grid_font_size(rows, cols), "bold")
+        font_changed = font_grid_tuple != self._grid_font
+
+        if (rows, cols) != (old_rows, old_cols):
+            # Quitar las celdas que sobran y el peso de sus filas/columnas
+            for r_idx, row_widgets in enumerate(self.grid_cell_widgets):
+                for c_idx, widget_cell in enumerate(row_widgets):
+                    if r_idx >= rows or c_idx >= cols:
+                        widget_cell.destroy()
+            for r_idx in range(rows, old_rows):
+                self.frame_sopa.grid_rowconfigure(r_idx, weight=0)
+            for c_idx in range(cols, old_cols):
+                self.frame_sopa.grid_columnconfigure(c_idx, weight=0)
+            for r_idx in range(old_rows, rows):
+                self.frame_sopa.grid_rowconfigure(r_idx, weight=1)
+            for c_idx in range(old_cols, cols):
+                self.frame_sopa.grid_columnconfigure(c_idx, weight=1)
+            self.grid_cell_widgets = [
+                [self.grid_cell_widgets[r_idx][c_idx] if r_idx < old_rows and c_idx < old_cols else None for c_idx in range(cols)]
+                for r_idx in range(rows)
+            ]
+            self._cell_letters = [
+                [self._cell_letters[r_idx][c_idx] if r_idx < old_rows and c_idx < old_cols else None for c_idx in range(cols)]
+                for r_idx in range(rows)
+            ]
+
+        selected = {tuple(pos) for pos in current_selection_path if 0 <= pos[0] < rows and 0 <= pos[1] < cols}
         for r_idx, row_letras in enumerate(board):
-            self.frame_sopa.grid_rowconfigure(r_idx, weight=1)
             for c_idx, letter in enumerate(row_letras):
-                self.frame_sopa.grid_columnconfigure(c_idx, weight=1)
-                cell_bg = self.ui_settings.COLORS['selected_cell_bg'] if (r_idx, c_idx) in current_selection_path else self.ui_settings.COLORS['grid']
-                cell_button = tk.Button(
-                    self.frame_sopa, text=letter,
-                    font=font_grid_tuple,
-                    borderwidth=1, relief=tk.SOLID,
-                    bg=cell_bg,
-                    fg=self.ui_settings.COLORS['grid_fg'],
-                    activebackground=self.ui_settings.COLORS['selected_cell_bg'],
-                    activeforeground=self.ui_settings.COLORS['grid_fg'],
-                    command=lambda r=r_idx, c=c_idx, l=letter: self.on_cell_click_callback(r, c, l)
-                )
-                cell_button.grid(row=r_idx, column=c_idx, padx=1, pady=1, sticky="nsew")
-                self.grid_cell_widgets[r_idx][c_idx] = cell_button
+                cell_bg = self.ui_settings.COLORS['selected_cell_bg'] if (r_idx, c_idx) in selected else self.ui_settings.COLORS['grid']
+                cell_button = self.grid_cell_widgets[r_idx][c_idx]
+                if cell_button is None:
+                    cell_button = tk.Button(
+                        self.frame_sopa, text=letter,
+                        font=font_grid_tuple,
+                        borderwidth=1, relief=tk.SOLID,
+                        bg=cell_bg,
+                        fg=self.ui_settings.COLORS['grid_fg'],
+                        activebackground=self.ui_settings.COLORS['selected_cell_bg'],
+                        activeforeground=self.ui_settings.COLORS['grid_fg'],
+                        # La letra se lee al hacer clic: el mismo botón sirve para cualquier tablero
+                        command=lambda r=r_idx, c=c_idx: self.on_cell_click_callback(r, c, self._cell_letters[r][c])
+                    )
+                    cell_button.grid(row=r_idx, column=c_idx, padx=1, pady=1, sticky="nsew")
+                    self.grid_cell_widgets[r_idx][c_idx] = cell_button
+                else:
+                    changes = {}
+                    if self._cell_letters[r_idx][c_idx] != letter:
+                        changes['text'] = letter
+                    if font_changed:
+                        changes['font'] = font_grid_tuple
+                    if ((r_idx, c_idx) in selected) != ((r_idx, c_idx) in self._highlighted):
+                        changes['bg'] = cell_bg
+                    if changes:
+                        cell_button.config(**changes)
+                self._cell_letters[r_idx][c_idx] = letter
+        self._grid_font = font_grid_tuple
+        self._highlighted = selected
 
     def update_board_selection(self, current_selection_path: List[Tuple[int, int]]):
-        """Actualiza visualmente la selección de celdas en el tablero."""
-        for r_idx in range(len(self.grid_cell_widgets)):
-            for c_idx in range(len(self.grid_cell_widgets[0])):
-                if self.grid_cell_widgets[r_idx][c_idx]:
-                    self.grid_cell_widgets[r_idx][c_idx].config(bg=self.ui_settings.COLORS['grid'])
-        for r_idx, c_idx in current_selection_path:
-            if 0 <= r_idx < len(self.grid_cell_widgets) and 0 <= c_idx < len(self.grid_cell_widgets[0]):
-                if self.grid_cell_widgets[r_idx][c_idx]:
-                    self.grid_cell_widgets[r_idx][c_idx].config(bg=self.ui_settings.COLORS['selected_cell_bg'])
+        """Actualiza visualmente la selección de celdas: solo repinta las celdas que cambiaron de estado."""
+        if self.board_canvas is not None:
+            self.board_canvas.update_selection({tuple(pos) for pos in current_selection_path})
+            return
+        rows = len(self.grid_cell_widgets)
+        cols = len(self.grid_cell_widgets[0]) if rows else 0
+        selected = {tuple(pos) for pos in current_selection_path if 0 <= pos[0] < rows and 0 <= pos[1] < cols}
+        for r_idx, c_idx in self._highlighted - selected:
+            self.grid_cell_widgets[r_idx][c_idx].config(bg=self.ui_settings.COLORS['grid'])
+        for r_idx, c_idx in selected - self._highlighted:
+            self.grid_cell_widgets[r_idx][c_idx].config(bg=self.ui_settings.COLORS['selected_cell_bg'])
+        self._highlighted = selected
 
     def display_word_list(self, words_by_length: Dict[int, List[str]], pal_encontradas: Set[str]):
-        """Dibuja o actualiza la lista de palabras a encontrar."""
-        for widget in self.frame_lista.winfo_children():
+        """
+        Dibuja o actualiza la lista de palabras a encontrar. Las cajas de letras se construyen
+        una vez por lista de palabras; si la lista no cambió (p. ej. al cargar la misma partida),
+        solo se repintan las palabras cuyo estado de encontrada cambió.
+        """
+        words_key = tuple((length, tuple(sorted(words_by_length[length]))) for length in sorted(words_by_length, reverse=True))
+        if words_key != self._word_list_key:
+            self._build_word_list(words_key)
+        for word_upper, letter_boxes in self.hint_labels.items():
+            is_found = word_upper in pal_encontradas
+            if is_found != (word_upper in self._shown_found):
+                self._paint_hint_word(word_upper, letter_boxes, is_found)
+
+    def _build_word_list(self, words_key: Tuple[Tuple[int, Tuple[str, ...]], ...]):
+        """Construye el panel de pistas con todas las palabras sin encontrar (solo la primera letra visible)."""
+        for widget in self.frame_lista_contenido.winfo_children():
             widget.destroy()
+        self._lista_canvas.yview_moveto(0)
+        self._word_list_key = words_key
+        self._shown_found = set()
+        self.hint_labels.clear()
         font_ui_tuple = (self.ui_settings.MAIN_FONT_FAMILY, self.ui_settings.UI_FONT_SIZE)
         font_ui_bold_tuple = (self.ui_settings.MAIN_FONT_FAMILY, self.ui_settings.UI_FONT_SIZE, "bold")
         font_hint_box_tuple = (self.ui_settings.MAIN_FONT_FAMILY, self.ui_settings.UI_FONT_SIZE - 1, "bold")
 
-        titulo = tk.Label(self.frame_lista, text="Palabras:", font=font_ui_bold_tuple, bg=self.ui_settings.COLORS['bg'], fg=self.ui_settings.COLORS['fg'])
+        titulo = tk.Label(self.frame_lista_contenido, text="Palabras:", font=font_ui_bold_tuple, bg=self.ui_settings.COLORS['bg'], fg=self.ui_settings.COLORS['fg'])
         titulo.pack(pady=(0, 10), anchor="w")
-        self.hint_labels.clear()
 
-        if not words_by_length:
-            info_label = tk.Label(self.frame_lista, text="No hay palabras...", font=font_ui_tuple, bg=self.ui_settings.COLORS['bg'], fg=self.ui_settings.COLORS['hint_fg'])
+        if not words_key:
+            info_label = tk.Label(self.frame_lista_contenido, text="No hay palabras...", font=font_ui_tuple, bg=self.ui_settings.COLORS['bg'], fg=self.ui_settings.COLORS['hint_fg'])
             info_label.pack(anchor="w")
             return
 
-        for length in sorted(words_by_length.keys(), reverse=True):
+        for length, words in words_key:
             subtitulo_text = f"{length} letras:"
-            subtitulo = tk.Label(self.frame_lista, text=subtitulo_text, font=font_ui_tuple, bg=self.ui_settings.COLORS['bg'], fg=self.ui_settings.COLORS['hint_fg'] )
+            subtitulo = tk.Label(self.frame_lista_contenido, text=subtitulo_text, font=font_ui_tuple, bg=self.ui_settings.COLORS['bg'], fg=self.ui_settings.COLORS['hint_fg'] )
             subtitulo.pack(pady=(8, 3), anchor="w")
-            for word_str in sorted(words_by_length[length]):
-                word_hint_container = tk.Frame(self.frame_lista, bg=self.ui_settings.COLORS['bg'])
+            for word_str in words:
+                word_hint_container = tk.Frame(self.frame_lista_contenido, bg=self.ui_settings.COLORS['bg'])
                 word_hint_container.pack(pady=2, padx=5, anchor="w")
                 letter_box_labels_for_word = []
-                is_found = word_str.upper() in pal_encontradas
                 for idx, char_in_palabra in enumerate(word_str):
-                    box_text = char_in_palabra.upper() if is_found else ""
-                    if not is_found and idx == 0:
-                        box_text = word_str[0].upper()
-
-                    box_fg = self.ui_settings.COLORS['found_word_fg'] if is_found else self.ui_settings.COLORS['hint_box_fg']
-
                     letter_box_label = tk.Label(
-                        word_hint_container, text=box_text, font=font_hint_box_tuple,
-                        bg=self.ui_settings.COLORS['hint_box_bg'], fg=box_fg,
+                        word_hint_container, text=char_in_palabra.upper() if idx == 0 else "", font=font_hint_box_tuple,
+                        bg=self.ui_settings.COLORS['hint_box_bg'], fg=self.ui_settings.COLORS['hint_box_fg'],
                         borderwidth=1, relief=tk.SOLID, width=2, height=1, anchor='center'
                     )
                     letter_box_label.pack(side=tk.LEFT, padx=1)
                     letter_box_labels_for_word.append(letter_box_label)
                 self.hint_labels[word_str.upper()] = letter_box_labels_for_word
 
+    def _paint_hint_word(self, word_upper: str, letter_boxes: List[tk.Label], found: bool):
+        """Muestra la palabra completa (encontrada) o solo su primera letra (pendiente)."""
+        if found:
+            for box_label, char in zip(letter_boxes, word_upper):
+                box_label.config(text=char, fg=self.ui_settings.COLORS['found_word_fg'])
+            self._shown_found.add(word_upper)
+        else:
+            for idx, box_label in enumerate(letter_boxes):
+                box_label.config(text=word_upper[0] if idx == 0 else "", fg=self.ui_settings.COLORS['hint_box_fg'])
+            self._shown_found.discard(word_upper)
+
     def update_found_word_display(self, word: str):
         """Actualiza la visualización de una palabra encontrada en la lista de pistas."""
         word_upper = word.upper()
-        if word_upper in self.hint_labels:
-            letter_boxes = self.hint_labels[word_upper]
-            for i, box_label in enumerate(letter_boxes):
-                if i < len(word):
-                    box_label.config(text=word[i].upper(), fg=self.ui_settings.COLORS['found_word_fg'])
+        if word_upper in self.hint_labels and word_upper not in self._shown_found:
+            self._paint_hint_word(word_upper, self.hint_labels[word_upper], True)
 
     # --- Métodos de actualización visual de etiquetas y mensajes ---
     def update_status_labels(self, found_count: int, target_count: int, score: int):
@@ -439,6 +554,8 @@ class GameUI:
             for row_widgets in self.grid_cell_widgets:
                 for widget_cell in row_widgets:
                     if widget_cell: widget_cell.config(state=NORMAL)
+        if self.board_canvas is not None:
+            self.board_canvas.set_enabled(True)
         self.entry.focus_set()
 
     def disable_game_controls(self):
@@ -454,6 +571,8 @@ class GameUI:
             for row_widgets in self.grid_cell_widgets:
                 for widget_cell in row_widgets:
                     if widget_cell: widget_cell.config(state=DISABLED)
+        if self.board_canvas is not None:
+            self.board_canvas.set_enabled(False)
 
     def show_game_interface(self):
         """Muestra los frames de la interfaz de juego y oculta otros."""
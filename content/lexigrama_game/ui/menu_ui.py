@@ -2,12 +2,13 @@
 import tkinter as tk
 from PIL import Image, ImageTk
 import os
+from utils.image_cache import foto_tk
 
 class MenuUI:
     """Gestiona la creación y actualización de la interfaz de usuario del menú principal."""
 
     # --- Inicialización y configuración ---
-    def __init__(self, root: tk.Tk, ui_settings, on_start_game, on_music_toggle, on_back_menu, on_how_to_play_menu_click, on_load_game, on_show_scores):
+    def __init__(self, root: tk.Tk, ui_settings, on_start_game, on_music_toggle, on_back_menu, on_how_to_play_menu_click, on_load_game, on_show_scores, on_grid_preset_toggle=None):
         self.root = root
         self.ui_settings = ui_settings
         self.on_start_game_callback = on_start_game
@@ -16,6 +17,7 @@ class MenuUI:
         self.on_how_to_play_menu_click = on_how_to_play_menu_click
         self.on_load_game_callback = on_load_game
         self.on_show_scores = on_show_scores
+        self.on_grid_preset_toggle = on_grid_preset_toggle
 
         self.logo_tk_image = None
         self.frame_menu = tk.Frame(root, bg=self.ui_settings.COLORS['bg'])
@@ -72,6 +74,13 @@ class MenuUI:
         )
         self.button_music_menu.pack(side="top", pady=(2, 0))
 
+        # Botón de tamaño de tablero (cambia entre los presets de GameSettings)
+        if self.on_grid_preset_toggle:
+            self.button_grid_preset = self._create_image_button(
+                self.left_buttons_frame, boton_img_path, "Tablero", self.on_grid_preset_toggle, width=180, height=45, hover_image_path=boton_hover_img_path
+            )
+            self.button_grid_preset.pack(side="top", pady=(2, 0))
+
         # Botón "Puntajes"
         self.button_scores = self._create_image_button(
             self.top_buttons_frame, boton_img_path, "Puntajes", self.on_show_scores, width=180, height=45, hover_image_path=boton_hover_img_path
@@ -102,13 +111,17 @@ class MenuUI:
         )
         self.button_exit_game.pack(pady=(5, 10))  # Antes: pady=10. Ahora: pady=(5, 10)
 
+        # Estado de la generación del tablero (el menú sigue visible mientras se genera)
+        self.label_status = tk.Label(self.frame_menu, text="", bg=self.ui_settings.COLORS['bg'],
+                                     fg=self.ui_settings.COLORS['message_fg'],
+                                     font=(self.ui_settings.MAIN_FONT_FAMILY, self.ui_settings.UI_FONT_SIZE))
+        self.label_status.pack(pady=(0, 10))
+
     def _create_image_button(self, parent, image_path, text, command, width=150, height=50, hover_image_path=None):
         """Crea un botón personalizado usando Canvas con imagen y texto, con efecto hover."""
         canvas = tk.Canvas(parent, width=width, height=height, highlightthickness=0, bg=self.ui_settings.COLORS['bg'])
         try:
-            img = Image.open(image_path)
-            img = img.resize((width, height), Image.Resampling.LANCZOS)
-            tk_img = ImageTk.PhotoImage(img)
+            tk_img = foto_tk(image_path, (width, height), master=canvas)
             canvas.normal_img = tk_img 
             canvas.create_image(0, 0, anchor='nw', image=tk_img)
         except Exception as e:
@@ -117,9 +130,7 @@ class MenuUI:
         # Imagen hover
         if hover_image_path:
             try:
-                hover_img = Image.open(hover_image_path)
-                hover_img = hover_img.resize((width, height), Image.Resampling.LANCZOS)
-                tk_hover_img = ImageTk.PhotoImage(hover_img)
+                tk_hover_img = foto_tk(hover_image_path, (width, height), master=canvas)
                 canvas.hover_img = tk_hover_img
             except Exception as e:
                 print(f"Error al cargar imagen hover para botón: {e}")
@@ -190,6 +201,14 @@ class MenuUI:
         if self.button_load_game:
             self.button_load_game.config(state='disabled')
 
+    def show_status(self, text: str):
+        """Muestra un mensaje de estado debajo de los botones del menú."""
+        self.label_status.config(text=text)
+
+    def clear_status(self):
+        """Borra el mensaje de estado del menú."""
+        self.label_status.config(text="")
+
     def update_music_button_text(self, text: str):
         """Actualiza el texto del botón de música en la interfaz del menú."""
         if hasattr(self, "button_music_menu"):
@@ -198,6 +217,11 @@ class MenuUI:
             else:
                 self.button_music_menu.itemconfig(self.button_music_menu.text_id, text="Música: OFF")
 
+    def update_grid_preset_text(self, text: str):
+        """Actualiza el texto del botón de tamaño de tablero."""
+        if hasattr(self, "button_grid_preset"):
+            self.button_grid_preset.itemconfig(self.button_grid_preset.text_id, text=text)
+
     def _exit_app(self):
         import os
         os._exit(0)
\ No newline at end of file
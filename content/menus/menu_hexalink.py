@@ -4,6 +4,8 @@ import subprocess
 import sys
 from PIL import Image
 from utils.ui_utils import sonido_click
+from utils.image_cache import imagen_ctk
+from Hexa_Link.game.prefetch import iniciar_productor
 
 # Ruta de la imagen del logo de Hexa-Link
 HEXALINK_IMG_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'recursos', 'hexalink.png')
@@ -26,13 +28,15 @@ class MenuHexaLink:
         self.parent_root = parent_root
         self.root = ctk.CTk()
         self.root.title("Hexa-Link")
-        self.root.geometry("540x480")
+        self.root.geometry("540x540")
         self.root.resizable(False, False)
         ctk.set_appearance_mode("dark")
         ctk.set_default_color_theme("dark-blue")
         self.root.configure(bg="#23272e")
         self.root.protocol("WM_DELETE_WINDOW", self.cerrar_total)
         self.hexalink_img = self.cargar_imagen()
+        # Genera en segundo plano los puzzles para que "Nueva partida" arranque al instante
+        iniciar_productor()
         self.construir_interfaz()
         self.root.mainloop()
         if self.parent_root is not None:
@@ -49,8 +53,7 @@ class MenuHexaLink:
         Uso: Solo en este menú.
         """
         if os.path.exists(HEXALINK_IMG_PATH):
-            pil_img = Image.open(HEXALINK_IMG_PATH).resize((140, 140), Image.NEAREST)
-            return ctk.CTkImage(dark_image=pil_img, size=(140, 140))
+            return imagen_ctk(HEXALINK_IMG_PATH, (140, 140), Image.NEAREST)
         return None
 
     def cerrar_total(self):
@@ -70,7 +73,7 @@ class MenuHexaLink:
         marco = ctk.CTkFrame(
             self.root,
             width=420,
-            height=410,
+            height=466,
             corner_radius=0,
             fg_color="#222831",
             border_width=5,
@@ -133,6 +136,12 @@ class MenuHexaLink:
             **btn_style, command=with_sound(self.nueva_partida)
         ).pack(pady=(0, 8))
 
+        # --- Botón: Puzzle diario (el mismo para todos los jugadores hoy) ---
+        ctk.CTkButton(
+            marco, text="Puzzle diario", fg_color="#393E46", hover_color="#00FFF7",
+            **btn_style, command=with_sound(self.puzzle_diario)
+        ).pack(pady=(0, 8))
+
         # --- Botón: Volver al menú de selección de juegos ---
         ctk.CTkButton(
             marco, text="Volver a seleccionar juego", fg_color="#222831", hover_color="#00FFF7",
@@ -177,6 +186,15 @@ class MenuHexaLink:
         working_dir = os.path.dirname(os.path.dirname(__file__))
         subprocess.Popen([sys.executable, '-m', 'Hexa_Link.run_game', self.usuario, 'nueva'], cwd=working_dir)
 
+    def puzzle_diario(self):
+        """
+        Lanza el juego en modo 'diario': el puzzle del día, sin guardar la partida.
+        Uso: Botón 'Puzzle diario'.
+        """
+        self.root.destroy()
+        working_dir = os.path.dirname(os.path.dirname(__file__))
+        subprocess.Popen([sys.executable, '-m', 'Hexa_Link.run_game', self.usuario, 'diario'], cwd=working_dir)
+
     def volver_seleccion(self):
         """
         Vuelve al menú de selección de juegos.
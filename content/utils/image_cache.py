@@ -0,0 +1,66 @@
+"""
+Caché de imágenes decodificadas compartida por los menús y los juegos (Tk y CustomTkinter).
+
+Abrir y redimensionar el mismo PNG para cada botón cada vez que se abre una ventana es caro;
+acá cada imagen se decodifica y redimensiona una sola vez por (ruta, tamaño, filtro) y se
+devuelve lista para usar. La caché es LRU y está acotada a MAX_IMAGENES entradas.
+
+Un PhotoImage pertenece al intérprete Tk en el que se creó, así que también entra en la clave;
+los CTkImage no están atados a ninguna ventana y se comparten entre todas.
+"""
+import os
+from collections import OrderedDict
+
+from PIL import Image, ImageTk
+
+MAX_IMAGENES = 64
+
+_imagenes = OrderedDict()
+
+
+def _clave(tipo, ruta, tamano, filtro, extra=None):
+    return (tipo, os.path.abspath(os.fspath(ruta)), tuple(tamano), filtro, extra)
+
+
+def _obtener(clave, crear):
+    imagen = _imagenes.get(clave)
+    if imagen is not None:
+        _imagenes.move_to_end(clave)
+        return imagen
+    imagen = _imagenes[clave] = crear()
+    while len(_imagenes) > MAX_IMAGENES:
+        _imagenes.popitem(last=False)
+    return imagen
+
+
+def imagen_pil(ruta, tamano, filtro=Image.Resampling.LANCZOS):
+    """Imagen PIL de la ruta redimensionada a `tamano` (ancho, alto). No modificar: es compartida."""
+    def crear():
+        with Image.open(ruta) as img:
+            return img.resize(tuple(tamano), filtro)
+    return _obtener(_clave("pil", ruta, tamano, filtro), crear)
+
+
+def foto_tk(ruta, tamano, filtro=Image.Resampling.LANCZOS, master=None):
+    """
+    ImageTk.PhotoImage de la ruta redimensionada a `tamano`, para el intérprete de `master`
+    (o la ventana Tk por defecto). Lanza la excepción de PIL si la imagen no se puede abrir.
+    """
+    if master is None:
+        import tkinter
+        master = tkinter._default_root
+    interprete = master.tk if master is not None else None
+    return _obtener(_clave("tk", ruta, tamano, filtro, interprete),
+                    lambda: ImageTk.PhotoImage(imagen_pil(ruta, tamano, filtro), master=master))
+
+
+def imagen_ctk(ruta, tamano, filtro=Image.Resampling.LANCZOS):
+    """customtkinter.CTkImage de la ruta redimensionada a `tamano`."""
+    import customtkinter as ctk  # Solo los menús CustomTkinter lo necesitan
+    return _obtener(_clave("ctk", ruta, tamano, filtro),
+                    lambda: ctk.CTkImage(dark_image=imagen_pil(ruta, tamano, filtro), size=tuple(tamano)))
+
+
+def limpiar():
+    """Vacía la caché (p. ej. si cambian las imágenes en disco)."""
+    _imagenes.clear()
@@ -0,0 +1,184 @@
+"""
+Léxico compilado compartido por Lexigrama y Hexa-Link.
+
+Las listas de palabras en texto se compilan una vez a un archivo binario (.lexb, junto al .txt)
+que se abre con mmap, así el arranque no vuelve a parsear el texto en cada partida.
+El archivo se recompila solo si el .txt es más nuevo.
+
+Formato (little-endian):
+    cabecera  : magic "LEXB", versión (u16), relleno (u16), cantidad n (u32), largo del blob (u32)
+    offsets   : u32[n + 1]  inicio de cada palabra dentro del blob
+    mascaras  : u32[n]      máscara de letras (SIN_MASCARA si usa letras fuera del alfabeto)
+    longitudes: u8[n]       largo en caracteres (saturado a 255)
+    blob      : palabras normalizadas en UTF-8, concatenadas
+
+Uso para compilar a mano (desde la carpeta content):
+    python -m utils.lexicon RUTA.txt [RUTA.txt ...]
+"""
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from array import array
+
+# Alfabeto de las máscaras: cada letra ocupa un bit (la ñ va después de la z)
+ALFABETO = "abcdefghijklmnopqrstuvwxyzñ"
+BIT_LETRA = {l: 1 << i for i, l in enumerate(ALFABETO)}
+SIN_MASCARA = 0xFFFFFFFF
+
+MAGIC = b"LEXB"
+VERSION = 1
+_HEADER = struct.Struct("<4sHHII")
+EXTENSION = ".lexb"
+
+_lexicones = {}
+
+
+def normalizar(linea):
+    """Normaliza una línea del archivo de palabras: sin espacios, sin comillas y en minúsculas."""
+    return linea.strip().strip('"').lower()
+
+
+def mascara_letras(palabra):
+    """Devuelve la máscara de bits de las letras de la palabra, o None si usa letras fuera del alfabeto."""
+    m = 0
+    for l in palabra:
+        b = BIT_LETRA.get(l)
+        if b is None:
+            return None
+        m |= b
+    return m
+
+
+def _u32(valores):
+    arr = array("I", valores)
+    if sys.byteorder != "little":
+        arr.byteswap()
+    return arr
+
+
+def compilar(path_txt, path_lexb=None):
+    """Compila el archivo de texto al formato binario y devuelve los bytes generados (y los guarda si se puede)."""
+    with open(path_txt, "r", encoding="utf-8") as f:
+        palabras = [w for w in (normalizar(l) for l in f) if w]
+    codificadas = [w.encode("utf-8") for w in palabras]
+    offsets = [0]
+    for b in codificadas:
+        offsets.append(offsets[-1] + len(b))
+    mascaras = []
+    for w in palabras:
+        m = mascara_letras(w)
+        mascaras.append(SIN_MASCARA if m is None else m)
+    blob = b"".join(codificadas)
+    datos = b"".join([
+        _HEADER.pack(MAGIC, VERSION, 0, len(palabras), len(blob)),
+        _u32(offsets).tobytes(),
+        _u32(mascaras).tobytes(),
+        bytes(min(len(w), 255) for w in palabras),
+        blob,
+    ])
+    if path_lexb is not None:
+        # Temporal propio de cada escritura: pueden compilar a la vez varios hilos o procesos
+        tmp_path = None
+        try:
+            fd, tmp_path = tempfile.mkstemp(prefix=f"{os.path.basename(path_lexb)}.", suffix=".tmp",
+                                            dir=os.path.dirname(os.path.abspath(path_lexb)))
+            with os.fdopen(fd, "wb") as f:
+                f.write(datos)
+            os.replace(tmp_path, path_lexb)
+        except OSError as e:
+            print(f"[LEXICON] No se pudo guardar {path_lexb}: {e}")
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+    return datos
+
+
+class Lexicon:
+    """Vista de solo lectura sobre un léxico compilado (mmap o bytes en memoria)."""
+
+    def __init__(self, buffer):
+        self._buffer = buffer
+        magic, version, _, n, largo_blob = _HEADER.unpack_from(buffer, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("Formato de léxico no reconocido")
+        if len(buffer) != _HEADER.size + 4 * (n + 1) + 4 * n + n + largo_blob:
+            raise ValueError("Léxico truncado o con un tamaño inconsistente con su cabecera")
+        vista = memoryview(buffer)
+        pos = _HEADER.size
+        self._offsets = self._tabla_u32(vista[pos:pos + 4 * (n + 1)])
+        pos += 4 * (n + 1)
+        self._mascaras = self._tabla_u32(vista[pos:pos + 4 * n])
+        pos += 4 * n
+        self._longitudes = vista[pos:pos + n]
+        pos += n
+        self._blob = vista[pos:pos + largo_blob]
+        self._n = n
+        self._palabras = None
+        if self._offsets[n] != largo_blob:
+            raise ValueError("Léxico con offsets inconsistentes")
+
+    @staticmethod
+    def _tabla_u32(vista):
+        if sys.byteorder == "little":
+            return vista.cast("I")
+        arr = array("I", vista.tobytes())
+        arr.byteswap()
+        return arr
+
+    def __len__(self):
+        return self._n
+
+    def palabra(self, i):
+        return str(self._blob[self._offsets[i]:self._offsets[i + 1]], "utf-8")
+
+    def longitud(self, i):
+        return self._longitudes[i]
+
+    def mascara(self, i):
+        """Máscara de letras de la palabra i, o None si usa letras fuera del alfabeto."""
+        m = self._mascaras[i]
+        return None if m == SIN_MASCARA else m
+
+    def palabras(self):
+        """Todas las palabras normalizadas, en el orden del archivo (se decodifican una sola vez)."""
+        if self._palabras is None:
+            texto = str(self._blob, "utf-8")
+            if len(texto) == len(self._blob):
+                # Solo ASCII: los offsets en bytes coinciden con los de caracteres
+                o = self._offsets
+                self._palabras = [texto[o[i]:o[i + 1]] for i in range(self._n)]
+            else:
+                self._palabras = [self.palabra(i) for i in range(self._n)]
+        return self._palabras
+
+
+def ruta_compilada(path_txt):
+    return os.fspath(path_txt) + EXTENSION
+
+
+def cargar_lexicon(path_txt):
+    """Abre (compilando si hace falta) el léxico de un archivo de palabras. Se cachea por proceso."""
+    path_txt = os.fspath(path_txt)
+    mtime_txt = os.path.getmtime(path_txt)  # FileNotFoundError si no existe el .txt
+    cache = _lexicones.get(path_txt)
+    if cache is not None and cache[0] == mtime_txt:
+        return cache[1]
+    path_lexb = ruta_compilada(path_txt)
+    lexicon = None
+    try:
+        if os.path.getmtime(path_lexb) >= mtime_txt:
+            with open(path_lexb, "rb") as f:
+                lexicon = Lexicon(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+    except (OSError, ValueError, struct.error):
+        lexicon = None
+    if lexicon is None:
+        lexicon = Lexicon(compilar(path_txt, path_lexb))
+    _lexicones[path_txt] = (mtime_txt, lexicon)
+    return lexicon
+
+
+if __name__ == "__main__":
+    for ruta in sys.argv[1:]:
+        datos = compilar(ruta, ruta_compilada(ruta))
+        print(f"[LEXICON] {ruta} -> {ruta_compilada(ruta)} ({len(datos)} bytes)")
@@ -0,0 +1,15 @@
+import datetime
+
+
+def semilla_diaria(fecha=None):
+    """
+    Semilla del puzzle diario: la misma para todos los jugadores en una fecha dada.
+    Args:
+        fecha (date | None): Fecha del puzzle; hoy si es None.
+    Returns:
+        int: Semilla con la forma AAAAMMDD.
+    Uso: Para generar el mismo puzzle del día en Hexa-Link (puzzle_diario).
+    """
+    if fecha is None:
+        fecha = datetime.date.today()
+    return int(fecha.strftime("%Y%m%d"))